@@ -0,0 +1,454 @@
+from array import array
+
+NULL = -1
+
+
+class NodeArena:
+    """
+    Stores nodes as positions in parallel arrays instead of one object per node. Every link field is an array of
+    integer positions, NULL marking a missing link, and the data lives in a single list. Released positions are kept
+    on a free list and reused by the next allocation.
+    """
+    def __init__(self, fields):
+        self.fields = fields
+        self.data = []
+        self.free = []
+        for field in fields:
+            setattr(self, field, array('q'))
+
+    def __len__(self):
+        return len(self.data) - len(self.free)
+
+    def allocate(self, data):
+        """Allocates a node with all of its links set to NULL.
+
+        :param data: Object - the data of the node.
+        :return: Integer - the position of the node in the arena.
+        """
+        if self.free:
+            node = self.free.pop()
+            self.data[node] = data
+            for field in self.fields:
+                getattr(self, field)[node] = NULL
+        else:
+            node = len(self.data)
+            self.data.append(data)
+            for field in self.fields:
+                getattr(self, field).append(NULL)
+        return node
+
+    def release(self, node):
+        """Releases a node so its position can be reused.
+
+        :param node: Integer - the position of the node in the arena.
+        """
+        self.data[node] = None
+        self.free.append(node)
+
+    def clear(self):
+        """
+        Releases every node and gives the memory of the arrays back.
+        """
+        self.data = []
+        self.free = []
+        for field in self.fields:
+            setattr(self, field, array('q'))
+
+
+class ArenaLinkedList:
+    """
+    Doubly linked LinkedList that keeps its elements in a NodeArena instead of Element objects.
+    """
+    def __init__(self):
+        self.arena = NodeArena(('prev', 'next'))
+        self.head = NULL
+        self.tail = NULL
+        self.size = 0
+
+    def __getitem__(self, item):
+        return self.get_element(item)
+
+    def __setitem__(self, key, value):
+        self.set_element(key, value)
+
+    def __len__(self):
+        return self.length()
+
+    def length(self):
+        """Returns the length of the LinkedList.
+
+        :return: Integer - length of the list.
+        """
+        return self.size
+
+    def get_element(self, index):
+        """Returns the element at the given index.
+
+        :param index: Integer - position of the element in the list.
+        :return: Object - the element at the given index.
+        """
+        return self.arena.data[self._node_at(index)]
+
+    def set_element(self, index, data):
+        """Sets the element at the given index to the provided object.
+
+        :param index: Integer - position of the element to set.
+        :param data: Object - the data for the element to be set.
+        """
+        self.arena.data[self._node_at(index)] = data
+
+    def insert_at_start(self, value):
+        """Inserts a provided element at the start of the list.
+
+        :param value: Object - the data to be inserted to the start of the list.
+        """
+        self._link_after(NULL, value)
+
+    def insert_at_end(self, value):
+        """Inserts a provided element at the end of the list.
+
+        :param value: Object - the data to be inserted to the end of the list.
+        """
+        self._link_after(self.tail, value)
+
+    def insert_at_index(self, index, value):
+        """Inserts an element at the provided index of the list.
+
+        :param index: Integer - the position of the element to be inserted.
+        :param value: Object - the data to be inserted to the provided index.
+        """
+        node = self._node_at(index)
+        self._link_after(self.arena.prev[node], value)
+
+    def insert_range(self, insert_range):
+        """Inserts a range of provided values to the list. Doesn't keep previous values.
+
+        :param insert_range: List - The list of values to be inserted.
+        """
+        if len(insert_range) == 0:
+            raise IndexError('Invalid index.')
+        else:
+            self.clear()
+            for value in insert_range:
+                self._link_after(self.tail, value)
+
+    def delete_at_start(self):
+        """Deletes the first element in the list.
+
+        :return: Object - the data of the deleted element, None if the list is empty.
+        """
+        if self.size > 0:
+            data = self.arena.data[self.head]
+            self._unlink(self.head)
+            return data
+
+    def delete_at_end(self):
+        """Deletes the last element in the list.
+
+        :return: Object - the data of the deleted element, None if the list is empty.
+        """
+        if self.size > 0:
+            data = self.arena.data[self.tail]
+            self._unlink(self.tail)
+            return data
+
+    def delete_at_index(self, index):
+        """Deletes an element at the given index.
+
+        :param index: Integer - index of element to be deleted.
+        """
+        self._unlink(self._node_at(index))
+
+    def delete_by_value(self, element_value):
+        """Deleted a provided element from the list based on it's value.
+
+        :param element_value: Object - the element to be deleted.
+        """
+        data = self.arena.data
+        next_links = self.arena.next
+        node = self.head
+        while node != NULL and data[node] != element_value:
+            node = next_links[node]
+        if node != NULL:
+            self._unlink(node)
+
+    def clear(self):
+        """Clears the list.
+        """
+        self.arena.clear()
+        self.head = NULL
+        self.tail = NULL
+        self.size = 0
+
+    def get_elements(self):
+        """Returns all elements in the list.
+
+        :return: List - all elements in the list.
+        """
+        if self.size == 0:
+            return None
+        else:
+            list_of_elements = []
+            data = self.arena.data
+            next_links = self.arena.next
+            node = self.head
+            while node != NULL:
+                list_of_elements.append(data[node])
+                node = next_links[node]
+
+            return list_of_elements
+
+    def print_elements(self):
+        """Prints all elements in the list.
+        """
+        if self.size == 0:
+            print('LinkedList is empty.')
+        else:
+            print(self.get_elements())
+
+    def _node_at(self, index):
+        """Walks to the element at a given index, from whichever end is closer.
+
+        :param index: Integer - position of the element in the list.
+        :return: Integer - the arena position of the element.
+        """
+        if index < 0 or index > self.size - 1:
+            raise IndexError('Invalid index.')
+
+        if index < self.size // 2:
+            next_links = self.arena.next
+            node = self.head
+            for _ in range(index):
+                node = next_links[node]
+        else:
+            prev_links = self.arena.prev
+            node = self.tail
+            for _ in range(self.size - 1 - index):
+                node = prev_links[node]
+        return node
+
+    def _link_after(self, previous, value):
+        """Allocates a new element and links it after another one.
+
+        :param previous: Integer - arena position to link after, NULL to link at the start.
+        :param value: Object - the data of the new element.
+        """
+        arena = self.arena
+        node = arena.allocate(value)
+        following = self.head if previous == NULL else arena.next[previous]
+        arena.prev[node] = previous
+        arena.next[node] = following
+        if previous == NULL:
+            self.head = node
+        else:
+            arena.next[previous] = node
+        if following == NULL:
+            self.tail = node
+        else:
+            arena.prev[following] = node
+        self.size += 1
+
+    def _unlink(self, node):
+        """Unlinks an element and releases its arena position.
+
+        :param node: Integer - arena position of the element.
+        """
+        arena = self.arena
+        previous = arena.prev[node]
+        following = arena.next[node]
+        if previous == NULL:
+            self.head = following
+        else:
+            arena.next[previous] = following
+        if following == NULL:
+            self.tail = previous
+        else:
+            arena.prev[following] = previous
+        arena.release(node)
+        self.size -= 1
+
+
+class ArenaBinaryTree:
+    """
+    Unbalanced binary search tree with the BinaryTreeNode operations that keeps its nodes in a NodeArena. Duplicates
+    are ignored, like in BinaryTreeNode.
+    """
+    def __init__(self):
+        self.arena = NodeArena(('left', 'right', 'parent'))
+        self.root = NULL
+
+    def __len__(self):
+        return len(self.arena)
+
+    def __iter__(self):
+        return self.iter_in_order()
+
+    def insert(self, value):
+        """Inserts a number into the tree. If duplicate the insert will be ignored.
+
+        :param value: Integer - the value to insert
+        """
+        arena = self.arena
+        if self.root == NULL:
+            self.root = arena.allocate(value)
+            return
+
+        data = arena.data
+        node = self.root
+        while data[node] != value:
+            links = arena.left if value < data[node] else arena.right
+            if links[node] == NULL:
+                child = arena.allocate(value)
+                arena.parent[child] = node
+                links[node] = child
+                return
+            node = links[node]
+
+    def delete(self, value):
+        """Deletes a number from the tree, replacing a node with two children by its in order successor.
+
+        :param value: Integer - the value to delete.
+        """
+        arena = self.arena
+        node = self._find(value)
+        if node == NULL:
+            return
+
+        if arena.left[node] != NULL and arena.right[node] != NULL:
+            successor = arena.right[node]
+            while arena.left[successor] != NULL:
+                successor = arena.left[successor]
+            arena.data[node] = arena.data[successor]
+            node = successor
+
+        child = arena.left[node] if arena.left[node] != NULL else arena.right[node]
+        parent = arena.parent[node]
+        if child != NULL:
+            arena.parent[child] = parent
+        if parent == NULL:
+            self.root = child
+        elif arena.left[parent] == node:
+            arena.left[parent] = child
+        else:
+            arena.right[parent] = child
+        arena.release(node)
+
+    def search(self, value):
+        """Binary search the tree for a given value.
+
+        :param value: Integer - the value to look for.
+        :return: Boolean - True if found, False if not.
+        """
+        return self._find(value) != NULL
+
+    def find_min(self):
+        """
+        Finds the minimum value in the tree, None if the tree is empty.
+        """
+        return self._extreme(self.arena.left)
+
+    def find_max(self):
+        """
+        Finds the maximum value in the tree, None if the tree is empty.
+        """
+        return self._extreme(self.arena.right)
+
+    def in_order_traversal(self):
+        """Traverses the tree from left to right. (left -> root -> right)
+
+        :return: List - list of numbers ordered.
+        """
+        return list(self.iter_in_order())
+
+    def pre_order_traversal(self):
+        """Traverses the tree in pre order (root -> left -> right)
+
+        :return: List - list of numbers ordered.
+        """
+        return list(self.iter_pre_order())
+
+    def post_order_traversal(self):
+        """Traverses the tree in post order (left -> right -> root)
+
+        :return: List - list of numbers ordered.
+        """
+        return list(self.iter_post_order())
+
+    def iter_in_order(self):
+        """Lazily traverses the tree from left to right. (left -> root -> right)
+
+        :return: Generator - yields the numbers in order, keeping only the current path in memory.
+        """
+        arena = self.arena
+        stack = []
+        node = self.root
+        while stack or node != NULL:
+            while node != NULL:
+                stack.append(node)
+                node = arena.left[node]
+            node = stack.pop()
+            yield arena.data[node]
+            node = arena.right[node]
+
+    def iter_pre_order(self):
+        """Lazily traverses the tree in pre order (root -> left -> right)
+
+        :return: Generator - yields the numbers in pre order.
+        """
+        arena = self.arena
+        stack = [self.root] if self.root != NULL else []
+        while stack:
+            node = stack.pop()
+            yield arena.data[node]
+            if arena.right[node] != NULL:
+                stack.append(arena.right[node])
+            if arena.left[node] != NULL:
+                stack.append(arena.left[node])
+
+    def iter_post_order(self):
+        """Lazily traverses the tree in post order (left -> right -> root)
+
+        :return: Generator - yields the numbers in post order.
+        """
+        arena = self.arena
+        stack = []
+        node = self.root
+        last_visited = NULL
+        while stack or node != NULL:
+            while node != NULL:
+                stack.append(node)
+                node = arena.left[node]
+            top = stack[-1]
+            if arena.right[top] != NULL and arena.right[top] != last_visited:
+                node = arena.right[top]
+            else:
+                stack.pop()
+                yield arena.data[top]
+                last_visited = top
+
+    def _find(self, value):
+        """Binary search the tree for the node holding a given value.
+
+        :param value: Integer - the value to look for.
+        :return: Integer - arena position of the node, NULL if not found.
+        """
+        arena = self.arena
+        data = arena.data
+        node = self.root
+        while node != NULL and data[node] != value:
+            node = arena.left[node] if value < data[node] else arena.right[node]
+        return node
+
+    def _extreme(self, links):
+        """Follows one kind of child link from the root as far as it goes.
+
+        :param links: Array - the left or right links of the arena.
+        :return: Integer - the value of the last node, None if the tree is empty.
+        """
+        if self.root == NULL:
+            return None
+
+        node = self.root
+        while links[node] != NULL:
+            node = links[node]
+        return self.arena.data[node]
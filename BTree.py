@@ -0,0 +1,278 @@
+from bisect import bisect_left
+
+_MISSING = object()
+
+
+class BTreeNode:
+    """
+    Node of a BTree holding a sorted list of keys, and one more child than keys unless it is a leaf.
+    """
+    __slots__ = ('keys', 'children')
+
+    def __init__(self, keys=None, children=None):
+        self.keys = keys if keys is not None else []
+        self.children = children if children is not None else []
+
+
+class BTree:
+    """
+    Ordered set of numbers with the BinaryTreeNode operations, stored as a B-tree. Every node keeps up to fan_out - 1
+    keys in one list and is binary searched with bisect, so a lookup follows only log(N) / log(fan_out) pointers
+    instead of log(N) and a range scan reads whole runs of keys at a time. Duplicates are ignored.
+
+    Insert splits full nodes and delete fills nodes at the minimum on the way down, so neither has to walk back up.
+    """
+    def __init__(self, values=(), fan_out=64):
+        """
+        :param values: Iterable - numbers to insert.
+        :param fan_out: Integer - maximum number of children of a node, even and at least 4.
+        """
+        if fan_out < 4 or fan_out % 2:
+            raise ValueError('Fan out must be an even number of at least 4.')
+
+        self.fan_out = fan_out
+        self.min_degree = fan_out // 2
+        self.root = BTreeNode()
+        self.size = 0
+        for value in values:
+            self.insert(value)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def __iter__(self):
+        return self.iter_in_order()
+
+    def insert(self, value):
+        """Inserts a number into the tree. If duplicate the insert will be ignored.
+
+        :param value: Integer - the value to insert
+        """
+        if len(self.root.keys) == self.fan_out - 1:
+            self.root = BTreeNode(children=[self.root])
+            self._split_child(self.root, 0)
+
+        node = self.root
+        while True:
+            index = bisect_left(node.keys, value)
+            if index < len(node.keys) and node.keys[index] == value:
+                return
+            if not node.children:
+                node.keys.insert(index, value)
+                self.size += 1
+                return
+
+            if len(node.children[index].keys) == self.fan_out - 1:
+                self._split_child(node, index)
+                if node.keys[index] == value:
+                    return
+                if node.keys[index] < value:
+                    index += 1
+            node = node.children[index]
+
+    def delete(self, value):
+        """Deletes a number from the tree.
+
+        :param value: Integer - the value to delete.
+        """
+        node = self.root
+        while True:
+            index = bisect_left(node.keys, value)
+            found = index < len(node.keys) and node.keys[index] == value
+            if not node.children:
+                if found:
+                    del node.keys[index]
+                    self.size -= 1
+                break
+
+            if found:
+                left, right = node.children[index], node.children[index + 1]
+                if len(left.keys) >= self.min_degree:
+                    # replace the value with its in order predecessor and delete that from the left subtree
+                    value = node.keys[index] = _last_key(left)
+                    node = left
+                elif len(right.keys) >= self.min_degree:
+                    value = node.keys[index] = _first_key(right)
+                    node = right
+                else:
+                    self._merge_children(node, index)
+                    node = left
+            else:
+                node = self._fill_child(node, index)
+
+        if not self.root.keys and self.root.children:
+            self.root = self.root.children[0]
+
+    def search(self, value):
+        """Binary search the tree for a given value.
+
+        :param value: Integer - the value to look for.
+        :return: Boolean - True if found, False if not.
+        """
+        node = self.root
+        while True:
+            index = bisect_left(node.keys, value)
+            if index < len(node.keys) and node.keys[index] == value:
+                return True
+            if not node.children:
+                return False
+            node = node.children[index]
+
+    def find_min(self):
+        """
+        Finds the minimum value in the tree, None if the tree is empty.
+        """
+        return _first_key(self.root) if self.size > 0 else None
+
+    def find_max(self):
+        """
+        Finds the maximum value in the tree, None if the tree is empty.
+        """
+        return _last_key(self.root) if self.size > 0 else None
+
+    def height(self):
+        """Returns the number of levels of the tree, every leaf is at the same level.
+
+        :return: Integer - the height of the tree, 1 for a single leaf.
+        """
+        height = 1
+        node = self.root
+        while node.children:
+            node = node.children[0]
+            height += 1
+        return height
+
+    def in_order_traversal(self):
+        """Traverses the tree from left to right. (left -> root -> right)
+
+        :return: List - list of numbers ordered.
+        """
+        return list(self.iter_in_order())
+
+    def iter_in_order(self):
+        """Lazily traverses the tree from left to right. (left -> root -> right)
+
+        :return: Generator - yields the numbers in order, keeping only the current path in memory.
+        """
+        return self._iter_from(_MISSING)
+
+    def range_iter(self, low, high):
+        """Lazily yields the numbers between two bounds, both inclusive, in ascending order. Starts at the lower bound
+        and reads whole leaves at a time, so O(log n + k) keys are visited.
+
+        :param low: Integer - the lower bound.
+        :param high: Integer - the upper bound.
+        :return: Generator - yields the numbers in the range.
+        """
+        for value in self._iter_from(low):
+            if high < value:
+                return
+            yield value
+
+    def _iter_from(self, low):
+        """Yields the numbers from a lower bound on in ascending order.
+
+        :param low: Integer - the lower bound, _MISSING to start at the minimum.
+        :return: Generator - yields the numbers.
+        """
+        stack = []
+        node = self.root
+        while node.children:
+            index = bisect_left(node.keys, low) if low is not _MISSING else 0
+            stack.append((node, index))
+            node = node.children[index]
+        start = bisect_left(node.keys, low) if low is not _MISSING else 0
+        yield from node.keys[start:]
+
+        while stack:
+            node, index = stack.pop()
+            if index < len(node.keys):
+                yield node.keys[index]
+                stack.append((node, index + 1))
+                node = node.children[index + 1]
+                while node.children:
+                    stack.append((node, 0))
+                    node = node.children[0]
+                yield from node.keys
+
+    def _split_child(self, parent, index):
+        """Splits a full child in two around its middle key, which moves up into the parent.
+
+        :param parent: BTreeNode - a node with room for one more key.
+        :param index: Integer - position of the full child.
+        """
+        child = parent.children[index]
+        middle = self.min_degree - 1
+        right = BTreeNode(child.keys[middle + 1:], child.children[middle + 1:])
+        parent.keys.insert(index, child.keys[middle])
+        parent.children.insert(index + 1, right)
+        del child.keys[middle:]
+        del child.children[middle + 1:]
+
+    def _merge_children(self, parent, index):
+        """Merges a child, the parent key after it and the next child into the first child.
+
+        :param parent: BTreeNode - the parent of both children.
+        :param index: Integer - position of the first child.
+        """
+        left = parent.children[index]
+        right = parent.children.pop(index + 1)
+        left.keys.append(parent.keys.pop(index))
+        left.keys.extend(right.keys)
+        left.children.extend(right.children)
+
+    def _fill_child(self, parent, index):
+        """Makes sure the child delete descends into has more than the minimum number of keys, by borrowing a key
+        through the parent from a sibling or by merging with a sibling.
+
+        :param parent: BTreeNode - the parent of the child.
+        :param index: Integer - position of the child.
+        :return: BTreeNode - the child to descend into, the merged node after a merge.
+        """
+        child = parent.children[index]
+        if len(child.keys) >= self.min_degree:
+            return child
+
+        if index > 0 and len(parent.children[index - 1].keys) >= self.min_degree:
+            sibling = parent.children[index - 1]
+            child.keys.insert(0, parent.keys[index - 1])
+            parent.keys[index - 1] = sibling.keys.pop()
+            if sibling.children:
+                child.children.insert(0, sibling.children.pop())
+        elif index < len(parent.keys) and len(parent.children[index + 1].keys) >= self.min_degree:
+            sibling = parent.children[index + 1]
+            child.keys.append(parent.keys[index])
+            parent.keys[index] = sibling.keys.pop(0)
+            if sibling.children:
+                child.children.append(sibling.children.pop(0))
+        elif index < len(parent.keys):
+            self._merge_children(parent, index)
+        else:
+            self._merge_children(parent, index - 1)
+            child = parent.children[index - 1]
+        return child
+
+
+def _first_key(node):
+    """Finds the smallest key below a node.
+
+    :param node: BTreeNode - the subtree root.
+    :return: Integer - the smallest key.
+    """
+    while node.children:
+        node = node.children[0]
+    return node.keys[0]
+
+
+def _last_key(node):
+    """Finds the largest key below a node.
+
+    :param node: BTreeNode - the subtree root.
+    :return: Integer - the largest key.
+    """
+    while node.children:
+        node = node.children[-1]
+    return node.keys[-1]
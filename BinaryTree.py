@@ -1,141 +1,480 @@
+from functools import lru_cache
+from operator import itemgetter
+
+_MISSING = object()
+
+
 class BinaryTreeNode:
     """
     Recursive BinaryTreeNode that holds info on its data, left, right and parent node.
+
+    With a key function the tree is ordered by the key of every value instead of the value itself. The key is computed
+    once when a value is inserted and cached on its node, every comparison uses only the cached keys, and search,
+    delete and the other lookups take a key instead of a whole value. The key function is the same for every node of a
+    tree, so it is held by a subclass made per key function, see keyed_node_class(), instead of by every node.
+
+    A plain node caches nothing about its subtree, so insert and delete never walk back up. AugmentedTreeNode caches
+    subtree sizes for order statistics and more.
     """
-    def __init__(self, value):
+    __slots__ = ('data', 'key', 'left', 'right', 'parent')
+    key_function = None
+
+    def __init__(self, value, cached_key=_MISSING):
+        """
+        :param value: Object - the data of the node.
+        :param cached_key: Object - the key of the value if it is already known, computed with the key function of the
+            class otherwise.
+        """
         self.data = value
+        if cached_key is _MISSING:
+            cached_key = self.key_function(value) if self.key_function is not None else value
+        self.key = cached_key
         self.left = None
         self.right = None
         self.parent = None
 
+    def __len__(self):
+        # a plain node does not know the size of its subtree, so it counts the nodes
+        return sum(1 for _ in self._iter_nodes())
+
+    def __bool__(self):
+        # a node always holds a value, without this a truth test would count the nodes through __len__
+        return True
+
+    def __iter__(self):
+        return self.iter_in_order()
+
+    def __reversed__(self):
+        return self.iter_reverse_order()
+
     def insert(self, value):
         """Inserts a number into the BinaryTree. If duplicate the insert will be ignored.
 
         :param value: Integer - the value to insert
         """
-        if self.data == value:
-            return
+        node = self._insert_node(value)
+        if node is not None:
+            self._repair_path(node.parent)
 
-        if value < self.data:
-            if self.left:
-                self.left.insert(value)
-            else:
-                self.left = BinaryTreeNode(value)
-                self.left.parent = self
-        else:
-            if self.right:
-                self.right.insert(value)
+    def _insert_node(self, value):
+        """Walks down to the insert position and attaches a new leaf there.
+
+        :param value: Integer - the value to insert
+        :return: BinaryTreeNode - the new leaf, None if the value was a duplicate.
+        """
+        key = self.key_function(value) if self.key_function is not None else value
+        node = self
+        while node.key != key:
+            if key < node.key:
+                if node.left is not None:
+                    node = node.left
+                else:
+                    node.left = type(self)(value, key)
+                    node.left.parent = node
+                    return node.left
             else:
-                self.right = BinaryTreeNode(value)
-                self.right.parent = self
+                if node.right is not None:
+                    node = node.right
+                else:
+                    node.right = type(self)(value, key)
+                    node.right.parent = node
+                    return node.right
+
+        return None
+
+    def bulk_insert(self, values):
+        """Inserts many numbers at once by merging them with the numbers already in the tree and rebuilding it
+        perfectly balanced. Duplicates will be ignored and this node stays the root.
+
+        :param values: Iterable - the values to insert.
+        """
+        merged = _merge_unique([(node.key, node.data) for node in self._iter_nodes()],
+                               _sorted_unique(values, self.key_function))
+        rebuilt = _build_from_sorted(type(self), merged, 0, len(merged) - 1)
+        self._copy_data(rebuilt)
+        self.left = rebuilt.left
+        self.right = rebuilt.right
+        if self.left:
+            self.left.parent = self
+        if self.right:
+            self.right.parent = self
+        self._update()
 
     def delete(self, value):
-        """Deletes a number from the BinaryTree and shrinks the tree from the right.
-
-        :param value: Integer - the value to delete.
-        """
-        if value == self.data:
-            if self.left is None and self.right is None:
-                return None
-            elif self.left is None:
-                self.right.parent = self.parent
-                return self.right
-            elif self.right is None:
-                self.left.parent = self.parent
-                return self.left
-
-            # update tree from right side
-            min_value = self.right.find_min()
-            self.data = min_value
-            self.right = self.right.delete(min_value)
-            # can also update tree from left side using self.left.find_max()
-        elif value < self.data:
-            if self.left:
-                self.left = self.left.delete(value)
-        elif value > self.data:
-            if self.right:
-                self.right = self.right.delete(value)
+        """Deletes a number from the BinaryTree and shrinks the tree from the right. Walks down in a loop, so deep
+        unbalanced trees do not hit the recursion limit.
+
+        :param value: Integer - the value to delete, its key for a tree with a key function.
+        :return: BinaryTreeNode - the root of the tree, None if the tree became empty.
+        """
+        node = self
+        while node is not None and node.key != value:
+            node = node.left if value < node.key else node.right
+
+        if node is None:
+            return self
+
+        if node.left is not None and node.right is not None:
+            # update tree from right side, the in order successor takes the place of the value and is removed instead
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node._copy_data(successor)
+            node = successor
+            # can also update tree from left side using the in order predecessor
+
+        child = node.left if node.left is not None else node.right
+        if child is not None:
+            child.parent = node.parent
+        if node is self:
+            return child
+
+        if node.parent.left is node:
+            node.parent.left = child
+        else:
+            node.parent.right = child
+        self._repair_path(node.parent)
 
         return self
 
+    def _update(self):
+        """
+        Recomputes the cached data of the subtree rooted at this node from its children, a plain node caches none.
+        """
+
+    def _copy_data(self, other):
+        """Copies the data of another node into this one, when a node takes over the place of another in the order.
+
+        :param other: BinaryTreeNode - the node to copy from.
+        """
+        self.data = other.data
+        self.key = other.key
+
+    def _swap_data(self, other):
+        """Swaps the data of this node with another one, used by rotations that keep the nodes in place.
+
+        :param other: BinaryTreeNode - the node to swap with.
+        """
+        self.data, other.data = other.data, self.data
+        self.key, other.key = other.key, self.key
+
+    def _repair_path(self, node):
+        """Restores the tree from the given node up to this node after insert or delete attached or removed a node
+        below it. A plain node caches nothing, so there is nothing to restore.
+
+        :param node: BinaryTreeNode - the parent of the attached or removed node.
+        """
+
     def find_min(self):
         """
         Finds the minimum value after the node it is called on.
         """
-        if self.left is None:
-            return self.data
-        else:
-            return self.left.find_min()
+        node = self
+        while node.left is not None:
+            node = node.left
+        return node.data
 
     def find_max(self):
         """
         Finds the maximum value after the node it is called on.
         """
-        if self.right is None:
-            return self.data
-        else:
-            return self.right.find_max()
+        node = self
+        while node.right is not None:
+            node = node.right
+        return node.data
 
     def search(self, value):
         """Binary search the tree for a given value.
 
-        :param value: Integer - the value to look for.
+        :param value: Integer - the value to look for, its key for a tree with a key function.
         :return: Boolean - True if found, False if not.
         """
-        if self.data == value:
-            return True
-        else:
-            if value < self.data:
-                if self.left:
-                    return self.left.search(value)
-                else:
-                    return False
+        node = self
+        while node is not None:
+            if node.key == value:
+                return True
+            elif value < node.key:
+                node = node.left
             else:
-                if self.right:
-                    return self.right.search(value)
-                else:
-                    return False
+                node = node.right
+
+        return False
+
+    def find_node(self, value):
+        """Binary search the tree for the node holding a given value.
+
+        :param value: Integer - the value to look for, its key for a tree with a key function.
+        :return: BinaryTreeNode - the node holding the value, None if not found.
+        """
+        node = self
+        while node is not None and node.key != value:
+            node = node.left if value < node.key else node.right
+        return node
+
+    def floor(self, value):
+        """Finds the largest number in the tree smaller than or equal to the given value.
+
+        :param value: Integer - the upper bound.
+        :return: Integer - the floor of the value, None if every number is larger.
+        """
+        node = self._floor_node(value)
+        return node.data if node is not None else None
+
+    def ceiling(self, value):
+        """Finds the smallest number in the tree larger than or equal to the given value.
+
+        :param value: Integer - the lower bound.
+        :return: Integer - the ceiling of the value, None if every number is smaller.
+        """
+        node = self._ceiling_node(value)
+        return node.data if node is not None else None
+
+    def _floor_node(self, value):
+        """
+        Returns the node holding the floor of the given value, None if there is none.
+        """
+        result = None
+        node = self
+        while node is not None:
+            if node.key == value:
+                return node
+            elif node.key < value:
+                result = node
+                node = node.right
+            else:
+                node = node.left
+        return result
+
+    def _ceiling_node(self, value):
+        """
+        Returns the node holding the ceiling of the given value, None if there is none.
+        """
+        result = None
+        node = self
+        while node is not None:
+            if node.key == value:
+                return node
+            elif value < node.key:
+                result = node
+                node = node.left
+            else:
+                node = node.right
+        return result
+
+    def successor(self):
+        """Finds the node holding the next larger number, following parent pointers when there is no right subtree.
+
+        :return: BinaryTreeNode - the in order successor, None if this node holds the largest number.
+        """
+        if self.right is not None:
+            node = self.right
+            while node.left is not None:
+                node = node.left
+            return node
+
+        node = self
+        while node.parent is not None and node.parent.right is node:
+            node = node.parent
+        return node.parent
+
+    def predecessor(self):
+        """Finds the node holding the next smaller number, following parent pointers when there is no left subtree.
+
+        :return: BinaryTreeNode - the in order predecessor, None if this node holds the smallest number.
+        """
+        if self.left is not None:
+            node = self.left
+            while node.right is not None:
+                node = node.right
+            return node
+
+        node = self
+        while node.parent is not None and node.parent.left is node:
+            node = node.parent
+        return node.parent
+
+    def range_iter(self, low, high):
+        """Lazily yields the numbers between two bounds, both inclusive, in ascending order. Starts at the ceiling of
+        the lower bound and follows successors, so only O(log n + k) nodes are visited.
+
+        :param low: Integer - the lower bound.
+        :param high: Integer - the upper bound.
+        :return: Generator - yields the numbers in the range.
+        """
+        node = self._ceiling_node(low)
+        while node is not None and not high < node.key:
+            yield node.data
+            node = node.successor()
+
+    def union(self, other):
+        """Builds a new balanced tree of the numbers in either tree by walking both in order together, O(n + m).
+
+        :param other: BinaryTreeNode - the other tree.
+        :return: BinaryTreeNode - a new tree of the same type as this one.
+        """
+        pairs = [(node.key, node.data) for node, _, _ in _lockstep(self._iter_nodes(), other._iter_nodes())]
+        return _build_from_sorted(type(self), pairs, 0, len(pairs) - 1)
+
+    def intersection(self, other):
+        """Builds a new balanced tree of the numbers in both trees. Walks both in order together in O(n + m), or
+        searches the larger tree for every number of the smaller one when that is cheaper.
+
+        :param other: BinaryTreeNode - the other tree.
+        :return: BinaryTreeNode - a new tree of the same type as this one, None if nothing is shared.
+        """
+        if _is_much_smaller(self, other):
+            nodes = [node for node in self._iter_nodes() if other.search(node.key)]
+        elif _is_much_smaller(other, self):
+            nodes = [node for node in other._iter_nodes() if self.search(node.key)]
+        else:
+            nodes = [node for node, in_self, in_other in _lockstep(self._iter_nodes(), other._iter_nodes())
+                     if in_self and in_other]
+        pairs = [(node.key, node.data) for node in nodes]
+        return _build_from_sorted(type(self), pairs, 0, len(pairs) - 1)
+
+    def difference(self, other):
+        """Builds a new balanced tree of the numbers in this tree that are not in the other. Walks both in order
+        together in O(n + m), or searches the other tree for every number of this one when that is cheaper.
+
+        :param other: BinaryTreeNode - the other tree.
+        :return: BinaryTreeNode - a new tree of the same type as this one, None if nothing is left.
+        """
+        if _is_much_smaller(self, other):
+            nodes = [node for node in self._iter_nodes() if not other.search(node.key)]
+        else:
+            nodes = [node for node, in_self, in_other in _lockstep(self._iter_nodes(), other._iter_nodes())
+                     if in_self and not in_other]
+        pairs = [(node.key, node.data) for node in nodes]
+        return _build_from_sorted(type(self), pairs, 0, len(pairs) - 1)
+
+    def issubset(self, other):
+        """Tells if every number of this tree is also in the other tree, stopping at the first one that is not.
+
+        :param other: BinaryTreeNode - the other tree.
+        :return: Boolean - True if this tree is a subset of the other.
+        """
+        if isinstance(self, AugmentedTreeNode) and isinstance(other, AugmentedTreeNode) and self.size > other.size:
+            return False
+        if _is_much_smaller(self, other):
+            return all(other.search(node.key) for node in self._iter_nodes())
+        return all(in_other for _, in_self, in_other in _lockstep(self._iter_nodes(), other._iter_nodes()) if in_self)
+
+    def freeze(self):
+        """Lays the numbers of the tree out in a SortedArray for fast batch lookups. The snapshot is not cached, keep it
+        for as long as the tree does not change and freeze again after an insert or delete.
+
+        :return: SortedArray - the numbers in ascending order.
+        """
+        from SortedArray import SortedArray
+
+        return SortedArray(node.key for node in self._iter_nodes())
+
+    def to_sorted_array(self):
+        """Returns the numbers of the tree in one contiguous buffer, see freeze().
+
+        :return: Array - the numbers in ascending order, a numpy array when NumPy is installed.
+        """
+        return self.freeze().keys
 
     def in_order_traversal(self):
         """Traverses the tree from left to right. (left -> root -> right)
 
         :return: List - list of numbers ordered.
         """
-        result_list = []
-        if self.left:
-            result_list += self.left.in_order_traversal()
-        result_list.append(self.data)
-        if self.right:
-            result_list += self.right.in_order_traversal()
-
-        return result_list
+        return list(self.iter_in_order())
 
     def pre_order_traversal(self):
         """Traverses the tree in pre order (root -> left -> right)
 
         :return: List - list of numbers ordered.
         """
-        result_list = [self.data]
-        if self.left:
-            result_list += self.left.pre_order_traversal()
-        if self.right:
-            result_list += self.right.pre_order_traversal()
-
-        return result_list
+        return list(self.iter_pre_order())
 
     def post_order_traversal(self):
         """Traverses the tree in post order (left -> right -> root)
 
         :return: List - list of numbers ordered.
         """
-        result_list = []
-        if self.left:
-            result_list += self.left.post_order_traversal()
-        if self.right:
-            result_list += self.right.post_order_traversal()
-        result_list.append(self.data)
+        return list(self.iter_post_order())
+
+    def iter_in_order(self):
+        """Lazily traverses the tree from left to right. (left -> root -> right)
+
+        :return: Generator - yields the numbers in order, keeping only the current path in memory.
+        """
+        stack = []
+        node = self
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.data
+            node = node.right
+
+    def _iter_nodes(self):
+        """Lazily walks the nodes of the tree from left to right.
+
+        :return: Generator - yields the nodes in order of their keys.
+        """
+        stack = []
+        node = self
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    def iter_reverse_order(self):
+        """Lazily traverses the tree from right to left. (right -> root -> left)
+
+        :return: Generator - yields the numbers in descending order.
+        """
+        stack = []
+        node = self
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            yield node.data
+            node = node.left
+
+    def iter_pre_order(self):
+        """Lazily traverses the tree in pre order (root -> left -> right)
+
+        :return: Generator - yields the numbers in pre order.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node.data
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
 
-        return result_list
+    def iter_post_order(self):
+        """Lazily traverses the tree in post order (left -> right -> root)
+
+        :return: Generator - yields the numbers in post order.
+        """
+        stack = []
+        node = self
+        last_visited = None
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            if top.right is not None and top.right is not last_visited:
+                node = top.right
+            else:
+                stack.pop()
+                yield top.data
+                last_visited = top
 
     def get_level(self):
         """Returns the level of the node in the tree, for printing purposes.
@@ -149,26 +488,409 @@ class BinaryTreeNode:
             p = p.parent
         return level
 
+    def get_height(self):
+        """Returns the height of the subtree rooted at this node by walking it level by level, O(1) on an
+        AugmentedTreeNode. A height far above log2(len(tree)) means the tree has degenerated towards a list.
+
+        :return: Integer - the number of levels, 1 for a single node.
+        """
+        height = 0
+        level = [self]
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+        return height
+
     def print_binary_tree(self):
         """
         Prints the BinaryTree horizontally.
         """
-        prefix = ' ' * self.get_level() * 3 + "-->{}" if self.parent else "-->{}"
-        print(prefix.format(self.data))
-        if self.right:
-            self.right.print_binary_tree()
+        # the level is looked up once and passed down, instead of walking the parents of every node
+        stack = [(self, self.get_level())]
+        while stack:
+            node, level = stack.pop()
+            prefix = ' ' * level * 3 + "-->{}" if node.parent else "-->{}"
+            print(prefix.format(node.data))
+            if node.left:
+                stack.append((node.left, level + 1))
+            if node.right:
+                stack.append((node.right, level + 1))
+
+
+class AugmentedTreeNode(BinaryTreeNode):
+    """
+    BinaryTreeNode that caches the size, height, minimum and maximum of its subtree. They are recomputed by _update
+    along the path an insert or delete changed, at the cost of walking back up after every change. In return len(),
+    get_height(), find_min() and find_max() are O(1), and rank(), select() and count_range() are O(height).
+    """
+    __slots__ = ('size', 'height', 'min_data', 'max_data')
+
+    def __init__(self, value, cached_key=_MISSING):
+        """
+        :param value: Object - the data of the node.
+        :param cached_key: Object - the key of the value if it is already known, computed with the key function of the
+            class otherwise.
+        """
+        super().__init__(value, cached_key)
+        self.size = 1
+        self.height = 1
+        self.min_data = value
+        self.max_data = value
+
+    def __len__(self):
+        return self.size
+
+    def _update(self):
+        """
+        Recomputes the size, height, minimum and maximum of the subtree rooted at this node from its children.
+        """
+        left = self.left
+        right = self.right
+        self.size = 1 + _size(left) + _size(right)
+        self.height = 1 + max(_height(left), _height(right))
+        self.min_data = left.min_data if left is not None else self.data
+        self.max_data = right.max_data if right is not None else self.data
+
+    def find_min(self):
+        """
+        Finds the minimum value after the node it is called on.
+        """
+        return self.min_data
+
+    def find_max(self):
+        """
+        Finds the maximum value after the node it is called on.
+        """
+        return self.max_data
+
+    def get_height(self):
+        """Returns the height of the subtree rooted at this node, cached so it is O(1).
+
+        :return: Integer - the number of levels, 1 for a single node.
+        """
+        return self.height
+
+    def rank(self, value):
+        """Counts the numbers in the tree smaller than the given value.
+
+        :param value: Integer - the value to rank.
+        :return: Integer - the number of smaller values, which is the index the value has or would have in order.
+        """
+        return self._count_below(value, False)
+
+    def select(self, index):
+        """Returns the number at the given position of the in order sequence.
+
+        :param index: Integer - position of the number, 0 is the smallest.
+        :return: Integer - the number at the given position.
+        """
+        if index < 0 or index > self.size - 1:
+            raise IndexError('Invalid index.')
+
+        node = self
+        while True:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.data
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def count_range(self, low, high):
+        """Counts the numbers in the tree between two bounds, both inclusive.
+
+        :param low: Integer - the lower bound.
+        :param high: Integer - the upper bound.
+        :return: Integer - the number of values in the range.
+        """
+        if high < low:
+            return 0
+        return self._count_below(high, True) - self._count_below(low, False)
+
+    def _count_below(self, value, inclusive):
+        """Counts the numbers in the tree smaller than the given value, or equal to it as well when inclusive.
+
+        :param value: Integer - the bound to count below.
+        :param inclusive: Boolean - count a value equal to the bound too.
+        :return: Integer - the number of values below the bound.
+        """
+        count = 0
+        node = self
+        while node is not None:
+            if node.key < value or (inclusive and node.key == value):
+                count += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def _update_path(self, node):
+        """Recomputes the cached data from the given node up to this node.
+
+        :param node: AugmentedTreeNode - the lowest node whose subtree changed.
+        """
+        while node is not None:
+            node._update()
+            if node is self:
+                break
+            node = node.parent
+
+    def _repair_path(self, node):
+        """Recomputes the cached data along the path above a node insert or delete attached or removed.
+
+        :param node: AugmentedTreeNode - the parent of the attached or removed node.
+        """
+        self._update_path(node)
+
+
+class AVLTreeNode(AugmentedTreeNode):
+    """
+    Self-balancing BinaryTreeNode that keeps the heights of every node's subtrees within one of each other.
+
+    Rotations swap data between nodes instead of relinking the node they start at, so the node insert is called on
+    stays the root of the tree.
+    """
+    __slots__ = ()
+
+    def _repair_path(self, node):
+        """Rebalances the path above a node insert or delete attached or removed.
+
+        :param node: AVLTreeNode - the parent of the attached or removed node.
+        """
+        self._rebalance_path(node)
+
+    def _rebalance_path(self, node):
+        """Updates heights and rotates where needed from the given node up to this node.
+
+        :param node: AVLTreeNode - the lowest node whose subtree changed.
+        """
+        while node is not None:
+            node._rebalance()
+            if node is self:
+                break
+            node = node.parent
+
+    def _rebalance(self):
+        """
+        Restores the AVL balance on this node with at most two rotations.
+        """
+        balance = _height(self.left) - _height(self.right)
+        if balance > 1:
+            if _height(self.left.left) < _height(self.left.right):
+                self.left._rotate_left()
+            self._rotate_right()
+        elif balance < -1:
+            if _height(self.right.right) < _height(self.right.left):
+                self.right._rotate_right()
+            self._rotate_left()
+        else:
+            self._update()
+
+    def _rotate_right(self):
+        """
+        Moves the left child's data up into this node, and this node's data down into the right subtree.
+        """
+        pivot = self.left
+        self._swap_data(pivot)
+        self.left = pivot.left
         if self.left:
-            self.left.print_binary_tree()
+            self.left.parent = self
+        pivot.left = pivot.right
+        pivot.right = self.right
+        if pivot.right:
+            pivot.right.parent = pivot
+        self.right = pivot
+        pivot._update()
+        self._update()
+
+    def _rotate_left(self):
+        """
+        Moves the right child's data up into this node, and this node's data down into the left subtree.
+        """
+        pivot = self.right
+        self._swap_data(pivot)
+        self.right = pivot.right
+        if self.right:
+            self.right.parent = self
+        pivot.right = pivot.left
+        pivot.left = self.left
+        if pivot.left:
+            pivot.left.parent = pivot
+        self.left = pivot
+        pivot._update()
+        self._update()
+
+
+def _size(node):
+    """Returns the number of nodes in a subtree, 0 for a missing child.
+
+    :param node: BinaryTreeNode - the subtree root or None.
+    :return: Integer - the size of the subtree.
+    """
+    return node.size if node is not None else 0
 
 
-def build_tree_from_list(numbers_list):
-    """Builds a BinaryTree from a list of integers. The first element is always the root.
+def _height(node):
+    """Returns the height of a subtree, 0 for a missing child.
+
+    :param node: BinaryTreeNode - the subtree root or None.
+    :return: Integer - the height of the subtree.
+    """
+    return node.height if node is not None else 0
+
+
+def _sorted_unique(values, key=None):
+    """Computes the key of every value once, sorts the values by their keys and drops values with duplicate keys.
+
+    :param values: Iterable - the values to sort.
+    :param key: Function - computes the key of a value, None to use the values as their keys.
+    :return: List - (key, value) tuples with distinct keys in ascending order, the first of equal keys kept.
+    """
+    if key is not None:
+        pairs = [(key(value), value) for value in values]
+    else:
+        pairs = [(value, value) for value in values]
+    pairs.sort(key=itemgetter(0))
+
+    result = []
+    for pair in pairs:
+        if not result or result[-1][0] != pair[0]:
+            result.append(pair)
+    return result
+
+
+def _merge_unique(first, second):
+    """Merges two ascending lists of (key, value) tuples with distinct keys into one, keeping the tuple of the first
+    list for keys found in both.
+
+    :param first: List - (key, value) tuples with ascending distinct keys.
+    :param second: List - (key, value) tuples with ascending distinct keys.
+    :return: List - the union of both lists in ascending order.
+    """
+    result = []
+    i = j = 0
+    while i < len(first) and j < len(second):
+        if first[i][0] == second[j][0]:
+            result.append(first[i])
+            i += 1
+            j += 1
+        elif first[i][0] < second[j][0]:
+            result.append(first[i])
+            i += 1
+        else:
+            result.append(second[j])
+            j += 1
+    result.extend(first[i:])
+    result.extend(second[j:])
+    return result
+
+
+def _lockstep(first, second):
+    """Walks the nodes of two trees in order together.
+
+    :param first: Iterator - nodes with ascending distinct keys.
+    :param second: Iterator - nodes with ascending distinct keys.
+    :return: Generator - yields a node for every key once in ascending order, the one of the first iterator for keys
+        in both, with whether the key came from the first and the second iterator.
+    """
+    first_node = next(first, None)
+    second_node = next(second, None)
+    while first_node is not None or second_node is not None:
+        if second_node is None or (first_node is not None and first_node.key < second_node.key):
+            yield first_node, True, False
+            first_node = next(first, None)
+        elif first_node is None or second_node.key < first_node.key:
+            yield second_node, False, True
+            second_node = next(second, None)
+        else:
+            yield first_node, True, True
+            first_node = next(first, None)
+            second_node = next(second, None)
+
+
+def _is_much_smaller(small, large):
+    """Tells if searching the large tree for every number of the small tree beats walking both trees. Only an
+    augmented tree knows its height, a plain one built from sorted numbers is a chain where every search costs n.
+
+    :param small: BinaryTreeNode - the tree whose numbers would be searched for.
+    :param large: BinaryTreeNode - the tree that would be searched.
+    :return: Boolean - True if m times the height of the large tree is below n + m.
+    """
+    if not isinstance(large, AugmentedTreeNode):
+        return False
+    small_size = len(small)
+    return small_size * large.height < small_size + large.size
+
+
+def _build_from_sorted(node_class, pairs, low, high):
+    """Builds a perfectly balanced tree from a slice of (key, value) tuples with ascending distinct keys, the middle
+    one becomes the root. The keys are cached on the nodes as they are, the key function is not called again.
+
+    :param node_class: Class - BinaryTreeNode or a subclass to create the nodes with.
+    :param pairs: List - (key, value) tuples with ascending distinct keys.
+    :param low: Integer - index of the first tuple in the slice.
+    :param high: Integer - index of the last tuple in the slice.
+    :return: BinaryTreeNode - the root of the subtree, None if the slice is empty.
+    """
+    if low > high:
+        return None
+
+    middle = (low + high) // 2
+    key, value = pairs[middle]
+    node = node_class(value, key)
+    node.left = _build_from_sorted(node_class, pairs, low, middle - 1)
+    if node.left:
+        node.left.parent = node
+    node.right = _build_from_sorted(node_class, pairs, middle + 1, high)
+    if node.right:
+        node.right.parent = node
+    node._update()
+    return node
+
+
+@lru_cache(maxsize=256)
+def keyed_node_class(node_class, key):
+    """Returns the subclass of a node class for trees ordered by a key function. The key function is a class attribute
+    of the subclass, so it is stored once per tree type instead of once per node. The subclasses are cached, so every
+    tree built with the same key function shares one.
+
+    :param node_class: Class - BinaryTreeNode or a subclass.
+    :param key: Function - computes the key the tree is ordered by from a value, None for the node class itself.
+    :return: Class - the subclass whose nodes compute their keys with the key function.
+    """
+    if key is None:
+        return node_class
+    return type(node_class.__name__, (node_class,), {'__slots__': (), 'key_function': staticmethod(key)})
+
+
+def build_tree_from_list(numbers_list, balanced=False, bulk=False, key=None, augmented=False):
+    """Builds a BinaryTree from a list of integers. The first element is always the root, unless bulk is set.
 
     :param numbers_list: List - list of numbers to build the tree from
+    :param balanced: Boolean - build a self-balancing AVLTreeNode tree, the root is then kept balanced as well.
+    :param bulk: Boolean - sort and deduplicate the numbers once and build a perfectly balanced tree from them in
+        O(N log N), the root is then the median.
+    :param key: Function - order the tree by the key of every value, computed once per value and cached on its node.
+        The nodes are then of the subclass keyed_node_class() makes for the key function.
+    :param augmented: Boolean - build an AugmentedTreeNode tree that caches the size, height, minimum and maximum of
+        every subtree for order statistics, an AVLTreeNode tree always does.
     :return:
     """
+    if balanced:
+        node_class = AVLTreeNode
+    elif augmented:
+        node_class = AugmentedTreeNode
+    else:
+        node_class = BinaryTreeNode
+    node_class = keyed_node_class(node_class, key)
+    if bulk:
+        sorted_pairs = _sorted_unique(numbers_list, key)
+        return _build_from_sorted(node_class, sorted_pairs, 0, len(sorted_pairs) - 1)
+
     if len(numbers_list) > 0:
-        binary_tree = BinaryTreeNode(numbers_list[0])
+        binary_tree = node_class(numbers_list[0])
 
         for i in range(1, len(numbers_list)):
             binary_tree.insert(numbers_list[i])
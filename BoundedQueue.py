@@ -0,0 +1,271 @@
+import asyncio
+import collections
+import queue
+import threading
+
+from DoubleLinkedList import LinkedList
+
+
+class AsyncBoundedQueue:
+    """
+    First in first out queue for asyncio tasks on top of a DoubleLinkedList, both ends are O(1). put waits while the
+    queue is full and get waits while it is empty, so fast producers are held back by slow consumers.
+
+    Every method must be called from the event loop thread, producers on other threads use put_threadsafe.
+    """
+    def __init__(self, maxsize=0):
+        """
+        :param maxsize: Integer - maximum number of items, 0 or less for no limit.
+        """
+        self.maxsize = maxsize
+        self.items = LinkedList()
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+
+    def __len__(self):
+        return len(self.items)
+
+    def qsize(self):
+        """Returns the number of items in the queue.
+
+        :return: Integer - number of items.
+        """
+        return len(self.items)
+
+    def empty(self):
+        """Tells if the queue has no items.
+
+        :return: Boolean - True if empty.
+        """
+        return len(self.items) == 0
+
+    def full(self):
+        """Tells if the queue has reached its maximum size.
+
+        :return: Boolean - True if full, always False without a limit.
+        """
+        return 0 < self.maxsize <= len(self.items)
+
+    async def put(self, item):
+        """Adds an item to the end of the queue, waiting for free space if the queue is full.
+
+        :param item: Object - the item to add.
+        """
+        while self.full():
+            await self._wait(self._putters, self.full)
+        self.put_nowait(item)
+
+    def put_nowait(self, item):
+        """Adds an item to the end of the queue without waiting.
+
+        :param item: Object - the item to add.
+        :raises asyncio.QueueFull: if the queue is full.
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self.items.insert_at_end(item)
+        _wake_next(self._getters)
+
+    def put_threadsafe(self, item, loop):
+        """Adds an item from a thread outside the event loop, for example a thread pool producer.
+
+        :param item: Object - the item to add.
+        :param loop: asyncio.AbstractEventLoop - the loop the queue is used in.
+        :return: concurrent.futures.Future - done once the item is in the queue, waiting on its result() blocks the
+            producer thread while the queue is full.
+        """
+        return asyncio.run_coroutine_threadsafe(self.put(item), loop)
+
+    async def get(self):
+        """Removes and returns the item at the start of the queue, waiting for one if the queue is empty.
+
+        :return: Object - the oldest item.
+        """
+        while self.empty():
+            await self._wait(self._getters, self.empty)
+        return self.get_nowait()
+
+    def get_nowait(self):
+        """Removes and returns the item at the start of the queue without waiting.
+
+        :return: Object - the oldest item.
+        :raises asyncio.QueueEmpty: if the queue is empty.
+        """
+        if self.empty():
+            raise asyncio.QueueEmpty
+        item = self.items.delete_at_start()
+        _wake_next(self._putters)
+        return item
+
+    async def get_many(self, count):
+        """Waits for at least one item, then removes and returns up to count items in one wakeup.
+
+        :param count: Integer - maximum number of items to return, at least one.
+        :return: List - the oldest items, at least one.
+        :raises ValueError: if count is smaller than one.
+        """
+        if count < 1:
+            raise ValueError('Count must be at least one.')
+        while self.empty():
+            await self._wait(self._getters, self.empty)
+        items = _drain(self.items, count)
+        for _ in items:
+            _wake_next(self._putters)
+        return items
+
+    async def _wait(self, waiters, blocked):
+        """Waits until woken by the other side of the queue. A cancelled waiter passes its wakeup on, so no wakeup
+        is lost while the queue could still make progress.
+
+        :param waiters: Deque - the getters or the putters.
+        :param blocked: Function - tells if the waiting side still has to wait.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            if not blocked() and not waiter.cancelled():
+                _wake_next(waiters)
+            raise
+
+
+class ThreadSafeBoundedQueue:
+    """
+    First in first out queue for threads on top of a DoubleLinkedList, both ends are O(1). put blocks while the queue
+    is full and get blocks while it is empty.
+    """
+    def __init__(self, maxsize=0):
+        """
+        :param maxsize: Integer - maximum number of items, 0 or less for no limit.
+        """
+        self.maxsize = maxsize
+        self.items = LinkedList()
+        lock = threading.Lock()
+        self._not_empty = threading.Condition(lock)
+        self._not_full = threading.Condition(lock)
+
+    def __len__(self):
+        return self.qsize()
+
+    def qsize(self):
+        """Returns the number of items in the queue.
+
+        :return: Integer - number of items.
+        """
+        with self._not_empty:
+            return len(self.items)
+
+    def empty(self):
+        """Tells if the queue has no items.
+
+        :return: Boolean - True if empty.
+        """
+        return self.qsize() == 0
+
+    def full(self):
+        """Tells if the queue has reached its maximum size.
+
+        :return: Boolean - True if full, always False without a limit.
+        """
+        with self._not_empty:
+            return self._full()
+
+    def put(self, item, block=True, timeout=None):
+        """Adds an item to the end of the queue, waiting for free space if the queue is full.
+
+        :param item: Object - the item to add.
+        :param block: Boolean - wait for free space, otherwise fail right away when full.
+        :param timeout: Float - maximum seconds to wait, None to wait forever.
+        :raises queue.Full: if no space became free.
+        """
+        with self._not_full:
+            if not self._not_full.wait_for(lambda: not self._full(), timeout if block else 0):
+                raise queue.Full
+            self.items.insert_at_end(item)
+            self._not_empty.notify()
+
+    def put_nowait(self, item):
+        """Adds an item to the end of the queue without waiting.
+
+        :param item: Object - the item to add.
+        :raises queue.Full: if the queue is full.
+        """
+        self.put(item, block=False)
+
+    def get(self, block=True, timeout=None):
+        """Removes and returns the item at the start of the queue, waiting for one if the queue is empty.
+
+        :param block: Boolean - wait for an item, otherwise fail right away when empty.
+        :param timeout: Float - maximum seconds to wait, None to wait forever.
+        :return: Object - the oldest item.
+        :raises queue.Empty: if no item arrived.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: len(self.items) > 0, timeout if block else 0):
+                raise queue.Empty
+            item = self.items.delete_at_start()
+            self._not_full.notify()
+            return item
+
+    def get_nowait(self):
+        """Removes and returns the item at the start of the queue without waiting.
+
+        :return: Object - the oldest item.
+        :raises queue.Empty: if the queue is empty.
+        """
+        return self.get(block=False)
+
+    def get_many(self, count, timeout=None):
+        """Waits for at least one item, then removes and returns up to count items while holding the lock once.
+
+        :param count: Integer - maximum number of items to return, at least one.
+        :param timeout: Float - maximum seconds to wait for the first item, None to wait forever.
+        :return: List - the oldest items, at least one.
+        :raises ValueError: if count is smaller than one.
+        :raises queue.Empty: if no item arrived.
+        """
+        if count < 1:
+            raise ValueError('Count must be at least one.')
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: len(self.items) > 0, timeout):
+                raise queue.Empty
+            items = _drain(self.items, count)
+            self._not_full.notify(len(items))
+            return items
+
+    def _full(self):
+        """
+        Tells if the queue is full, the caller holds the lock.
+        """
+        return 0 < self.maxsize <= len(self.items)
+
+
+def _wake_next(waiters):
+    """Wakes the longest waiting future that is still waiting.
+
+    :param waiters: Deque - the getters or the putters.
+    """
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            break
+
+
+def _drain(items, count):
+    """Removes up to count items from the start of a list.
+
+    :param items: LinkedList - the list to drain.
+    :param count: Integer - maximum number of items to remove.
+    :return: List - the removed items in order.
+    """
+    drained = []
+    while len(drained) < count and len(items) > 0:
+        drained.append(items.delete_at_start())
+    return drained
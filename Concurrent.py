@@ -0,0 +1,360 @@
+import functools
+import threading
+from contextlib import contextmanager
+
+import BinaryTree
+import DoubleLinkedList
+
+
+class ReadWriteLock:
+    """
+    Lock that lets any number of readers in at once but a writer only alone. Waiting writers stop new readers from
+    entering, so a steady stream of readers cannot starve them.
+    """
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writing = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self):
+        """
+        Holds the lock for reading inside a with block.
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        """
+        Holds the lock for writing inside a with block.
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+    def acquire_read(self):
+        """
+        Waits until no writer holds or waits for the lock, then enters as a reader.
+        """
+        with self._condition:
+            while self._writing or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self):
+        """
+        Leaves as a reader and wakes the waiting writers when the last reader left.
+        """
+        with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        """
+        Waits until no reader or writer holds the lock, then enters as the only writer.
+        """
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writing or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writing = True
+
+    def release_write(self):
+        """
+        Leaves as the writer and wakes everyone waiting.
+        """
+        with self._condition:
+            self._writing = False
+            self._condition.notify_all()
+
+
+def _reading(method):
+    """Creates a method that calls the same method of the wrapped structure while holding the lock for reading.
+
+    :param method: Function - the method of the structure, its name and docstring are reused.
+    :return: Function - the locking method.
+    """
+    @functools.wraps(method)
+    def locked(self, *args, **kwargs):
+        with self.lock.read():
+            return getattr(self.wrapped, method.__name__)(*args, **kwargs)
+
+    return locked
+
+
+def _writing(method):
+    """Creates a method that calls the same method of the wrapped structure while holding the lock for writing.
+
+    :param method: Function - the method of the structure, its name and docstring are reused.
+    :return: Function - the locking method.
+    """
+    @functools.wraps(method)
+    def locked(self, *args, **kwargs):
+        with self.lock.write():
+            return getattr(self.wrapped, method.__name__)(*args, **kwargs)
+
+    return locked
+
+
+class ConcurrentLinkedList:
+    """
+    LinkedList that can be shared between threads. Reads run in parallel, writes run alone, and every compound
+    operation such as insert_at_index or delete_by_value runs under a single lock so nothing can change in between.
+    """
+    def __init__(self, linked_list=None):
+        """
+        :param linked_list: LinkedList - the list to guard, a new DoubleLinkedList by default. It must not be used
+            directly anymore.
+        """
+        self.wrapped = linked_list if linked_list is not None else DoubleLinkedList.LinkedList()
+        self.lock = ReadWriteLock()
+
+    def __iter__(self):
+        with self.lock.read():
+            return iter(list(self.wrapped))
+
+    __len__ = _reading(DoubleLinkedList.LinkedList.__len__)
+    __contains__ = _reading(DoubleLinkedList.LinkedList.__contains__)
+    __getitem__ = _reading(DoubleLinkedList.LinkedList.__getitem__)
+    __setitem__ = _writing(DoubleLinkedList.LinkedList.__setitem__)
+    length = _reading(DoubleLinkedList.LinkedList.length)
+    get_element = _reading(DoubleLinkedList.LinkedList.get_element)
+    get_slice = _reading(DoubleLinkedList.LinkedList.get_slice)
+    get_elements = _reading(DoubleLinkedList.LinkedList.get_elements)
+    set_element = _writing(DoubleLinkedList.LinkedList.set_element)
+    insert_at_start = _writing(DoubleLinkedList.LinkedList.insert_at_start)
+    insert_at_end = _writing(DoubleLinkedList.LinkedList.insert_at_end)
+    insert_at_index = _writing(DoubleLinkedList.LinkedList.insert_at_index)
+    insert_before_element = _writing(DoubleLinkedList.LinkedList.insert_before_element)
+    insert_after_element = _writing(DoubleLinkedList.LinkedList.insert_after_element)
+    insert_range = _writing(DoubleLinkedList.LinkedList.insert_range)
+    extend = _writing(DoubleLinkedList.LinkedList.extend)
+    delete_at_start = _writing(DoubleLinkedList.LinkedList.delete_at_start)
+    delete_at_end = _writing(DoubleLinkedList.LinkedList.delete_at_end)
+    delete_at_index = _writing(DoubleLinkedList.LinkedList.delete_at_index)
+    delete_by_value = _writing(DoubleLinkedList.LinkedList.delete_by_value)
+    sort = _writing(DoubleLinkedList.LinkedList.sort)
+    clear = _writing(DoubleLinkedList.LinkedList.clear)
+
+    def get_elements_at(self, indexes):
+        """Returns the elements at many indexes while holding the lock once.
+
+        :param indexes: Iterable - positions of the elements.
+        :return: List - the elements in the order of the indexes.
+        """
+        with self.lock.read():
+            return [self.wrapped.get_element(index) for index in indexes]
+
+    def delete_by_values(self, values):
+        """Deletes the first element holding each of many values while holding the lock once.
+
+        :param values: Iterable - the values to delete.
+        """
+        with self.lock.write():
+            for value in values:
+                self.wrapped.delete_by_value(value)
+
+    def print_elements(self):
+        """Prints all elements in the list.
+        """
+        with self.lock.read():
+            self.wrapped.print_elements()
+
+
+class ConcurrentBinaryTree:
+    """
+    BinaryTree that can be shared between threads. Searches and traversals run in parallel, inserts and deletes run
+    alone. The tree is held by its root, which can change or become None as numbers are deleted.
+    """
+    def __init__(self, values=(), balanced=True):
+        """
+        :param values: Iterable - numbers to bulk load the tree with.
+        :param balanced: Boolean - use a self-balancing AVLTreeNode tree, an unbalanced AugmentedTreeNode tree
+            otherwise. Both keep subtree sizes, so rank and count_range work either way.
+        """
+        self.balanced = balanced
+        self.wrapped = BinaryTree.build_tree_from_list(list(values), balanced=balanced, bulk=True, augmented=True)
+        self.lock = ReadWriteLock()
+
+    def __len__(self):
+        with self.lock.read():
+            return len(self.wrapped) if self.wrapped is not None else 0
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def insert(self, value):
+        """Inserts a number into the tree. If duplicate the insert will be ignored.
+
+        :param value: Integer - the value to insert
+        """
+        with self.lock.write():
+            self._insert(value)
+
+    def insert_many(self, values):
+        """Inserts many numbers while holding the lock once.
+
+        :param values: Iterable - the values to insert.
+        """
+        with self.lock.write():
+            for value in values:
+                self._insert(value)
+
+    def bulk_insert(self, values):
+        """Merges many numbers into the tree and rebuilds it balanced while holding the lock once.
+
+        :param values: Iterable - the values to insert.
+        """
+        with self.lock.write():
+            if self.wrapped is None:
+                self.wrapped = BinaryTree.build_tree_from_list(list(values), balanced=self.balanced, bulk=True,
+                                                               augmented=True)
+            else:
+                self.wrapped.bulk_insert(values)
+
+    def delete(self, value):
+        """Deletes a number from the tree.
+
+        :param value: Integer - the value to delete.
+        """
+        with self.lock.write():
+            if self.wrapped is not None:
+                self.wrapped = self.wrapped.delete(value)
+
+    def delete_many(self, values):
+        """Deletes many numbers while holding the lock once.
+
+        :param values: Iterable - the values to delete.
+        """
+        with self.lock.write():
+            for value in values:
+                if self.wrapped is None:
+                    break
+                self.wrapped = self.wrapped.delete(value)
+
+    def search(self, value):
+        """Binary search the tree for a given value.
+
+        :param value: Integer - the value to look for.
+        :return: Boolean - True if found, False if not.
+        """
+        with self.lock.read():
+            return self.wrapped is not None and self.wrapped.search(value)
+
+    def search_many(self, values):
+        """Searches for many numbers while holding the lock once.
+
+        :param values: Iterable - the values to look for.
+        :return: List - True or False for every value, in order.
+        """
+        with self.lock.read():
+            if self.wrapped is None:
+                return [False for _ in values]
+            return [self.wrapped.search(value) for value in values]
+
+    def find_min(self):
+        """
+        Finds the minimum value in the tree, None if the tree is empty.
+        """
+        return self._read('find_min', None)
+
+    def find_max(self):
+        """
+        Finds the maximum value in the tree, None if the tree is empty.
+        """
+        return self._read('find_max', None)
+
+    def floor(self, value):
+        """Finds the largest number in the tree smaller than or equal to the given value.
+
+        :param value: Integer - the upper bound.
+        :return: Integer - the floor of the value, None if there is none.
+        """
+        return self._read('floor', None, value)
+
+    def ceiling(self, value):
+        """Finds the smallest number in the tree larger than or equal to the given value.
+
+        :param value: Integer - the lower bound.
+        :return: Integer - the ceiling of the value, None if there is none.
+        """
+        return self._read('ceiling', None, value)
+
+    def rank(self, value):
+        """Counts the numbers in the tree smaller than the given value.
+
+        :param value: Integer - the value to rank.
+        :return: Integer - the number of smaller values.
+        """
+        return self._read('rank', 0, value)
+
+    def count_range(self, low, high):
+        """Counts the numbers in the tree between two bounds, both inclusive.
+
+        :param low: Integer - the lower bound.
+        :param high: Integer - the upper bound.
+        :return: Integer - the number of values in the range.
+        """
+        return self._read('count_range', 0, low, high)
+
+    def range_list(self, low, high):
+        """Returns the numbers between two bounds, both inclusive, collected under one read lock.
+
+        :param low: Integer - the lower bound.
+        :param high: Integer - the upper bound.
+        :return: List - the numbers in the range in ascending order.
+        """
+        with self.lock.read():
+            return list(self.wrapped.range_iter(low, high)) if self.wrapped is not None else []
+
+    def in_order_traversal(self):
+        """Traverses the tree from left to right. (left -> root -> right)
+
+        :return: List - list of numbers ordered.
+        """
+        return self._read('in_order_traversal', [])
+
+    def pre_order_traversal(self):
+        """Traverses the tree in pre order (root -> left -> right)
+
+        :return: List - list of numbers ordered.
+        """
+        return self._read('pre_order_traversal', [])
+
+    def post_order_traversal(self):
+        """Traverses the tree in post order (left -> right -> root)
+
+        :return: List - list of numbers ordered.
+        """
+        return self._read('post_order_traversal', [])
+
+    def _insert(self, value):
+        """Inserts a number, the caller holds the lock for writing.
+
+        :param value: Integer - the value to insert
+        """
+        if self.wrapped is None:
+            self.wrapped = BinaryTree.build_tree_from_list([value], balanced=self.balanced, augmented=True)
+        else:
+            self.wrapped.insert(value)
+
+    def _read(self, name, empty, *args):
+        """Calls a method of the root while holding the lock for reading.
+
+        :param name: String - name of the BinaryTreeNode method.
+        :param empty: Object - the result for an empty tree.
+        :return: Object - the result of the method.
+        """
+        with self.lock.read():
+            if self.wrapped is None:
+                return empty
+            return getattr(self.wrapped, name)(*args)
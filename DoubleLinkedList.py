@@ -1,7 +1,12 @@
+from operator import attrgetter
+
+
 class Element:
     """
     Helper class for LinkedList.
     """
+    __slots__ = ('data', 'prev', 'next')
+
     def __init__(self, data=None, prev=None, next=None):
         self.data = data
         self.prev = prev
@@ -11,34 +16,50 @@ class Element:
 class LinkedList:
     """
     LinkedList class where each element is linked to the previous element.
+
+    With index_values set the list also keeps a dict from each value to the elements holding it, so membership tests
+    and value based inserts and deletes are O(1) for values held once. Values must be hashable in that mode.
     """
-    def __init__(self, head=None):
+    def __init__(self, head=None, index_values=False):
         self.head = head
+        self.tail = None
+        self.size = 0
+        self.value_index = {} if index_values else None
+        iterator = head
+        while iterator:
+            self.tail = iterator
+            self.size += 1
+            self._index_add(iterator)
+            iterator = iterator.next
 
     def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.get_slice(item)
         return self.get_element(item)
 
+    def __iter__(self):
+        iterator = self.head
+        while iterator is not None:
+            yield iterator.data
+            iterator = iterator.next
+
     def __setitem__(self, key, value):
         self.set_element(key, value)
 
     def __len__(self):
         return self.length()
 
+    def __contains__(self, value):
+        if self.value_index is not None:
+            return value in self.value_index
+        return self._find_element(value) is not None
+
     def length(self):
         """Returns the length of the LinkedList.
 
         :return: Integer - length of the list.
         """
-        if self.head is None:
-            return 0
-        else:
-            length = 1
-            iterator = self.head
-            while iterator.next:
-                length += 1
-                iterator = iterator.next
-
-            return length
+        return self.size
 
     def get_element(self, index):
         """Returns the element at the given index.
@@ -46,8 +67,10 @@ class LinkedList:
         :param index: Integer - position of the element in the list.
         :return: Object - the element at the given index.
         """
-        if index < 0 or index > self.length() - 1:
+        if index < 0 or index > self.size - 1:
             raise IndexError('Invalid index.')
+        elif index == self.size - 1:
+            return self.tail.data
         else:
             position = 0
             iterator = self.head
@@ -63,8 +86,10 @@ class LinkedList:
         :param index: Integer - position of the element to set.
         :param data: Object - the data for the element to be set.
         """
-        if index < 0 or index > self.length() - 1:
+        if index < 0 or index > self.size - 1:
             raise IndexError('Invalid index.')
+        elif index == self.size - 1:
+            iterator = self.tail
         else:
             position = 0
             iterator = self.head
@@ -72,36 +97,29 @@ class LinkedList:
                 iterator = iterator.next
                 position += 1
 
-            iterator.data = data
+        self._index_remove(iterator)
+        iterator.data = data
+        self._index_add(iterator)
 
     def insert_at_start(self, value):
         """Inserts a provided element at the start of the list.
 
         :param value: Object - the data to be inserted to the start of the list.
+        :return: Element - the inserted element, usable with remove_element and the move methods.
         """
-        if self.head is None:
-            self.head = Element(value)
-        else:
-            element = Element(value)
-            element.next = self.head
-            self.head.prev = element
-            self.head = element
+        element = Element(value)
+        self._link_after(None, element)
+        return element
 
     def insert_at_end(self, value):
         """Inserts a provided element at the end of the list.
 
         :param value: Object - the data to be inserted to the end of the list.
+        :return: Element - the inserted element, usable with remove_element and the move methods.
         """
-        if self.head is None:
-            self.head = Element(value)
-        else:
-            last_element = self.head
-            while last_element.next:
-                last_element = last_element.next
-
-            element = Element(value)
-            element.prev = last_element
-            last_element.next = element
+        element = Element(value)
+        self._link_after(self.tail, element)
+        return element
 
     def insert_at_index(self, index, value):
         """Inserts an element at the provided index of the list.
@@ -109,8 +127,10 @@ class LinkedList:
         :param index: Integer - the position of the element to be inserted.
         :param value: Object - the data to be inserted to the provided index.
         """
-        if index < 0 or index > self.length() - 1:
+        if index < 0 or index > self.size - 1:
             raise IndexError('Invalid index.')
+        elif index == 0:
+            self.insert_at_start(value)
         else:
             position = 0
             iterator = self.head
@@ -118,11 +138,7 @@ class LinkedList:
                 iterator = iterator.next
                 position += 1
 
-            element = Element(value)
-            element.next = iterator.next
-            element.prev = iterator
-            iterator.next.prev = element
-            iterator.next = element
+            self._link_after(iterator, Element(value))
 
     def insert_before_element(self, element_value, element_before):
         """Inserts a provided element before another element in the list.
@@ -130,23 +146,9 @@ class LinkedList:
         :param element_value: Object - the data to be inserted.
         :param element_before: Object - the element before which the data is inserted.
         """
-        if element_before in self.get_elements():
-            iterator = self.head
-            if iterator.data == element_before:
-                new_element = Element(element_value)
-                new_element.next = iterator
-                self.head = new_element
-            else:
-                while iterator.next:
-                    if iterator.next.data == element_before:
-                        new_element = Element(element_value)
-                        new_element.next = iterator.next
-                        new_element.prev = iterator
-                        iterator.next.prev = new_element
-                        iterator.next = new_element
-                        break
-
-                    iterator = iterator.next
+        element = self._find_element(element_before)
+        if element is not None:
+            self._link_after(element.prev, Element(element_value))
         else:
             print("Element doesn't exist in the LinkedList.")
 
@@ -156,25 +158,48 @@ class LinkedList:
         :param element_value: Object - the data to be inserted.
         :param element_after: Object - the element after which the data is inserted.
         """
-        if element_after in self.get_elements():
-            iterator = self.head
-            if iterator.data == element_after:
-                new_element = Element(element_value)
-                new_element.next = iterator.next
-                iterator.next = new_element
-            else:
-                while iterator.next:
-                    iterator = iterator.next
-                    if iterator.data == element_after:
-                        new_element = Element(element_value)
-                        new_element.next = iterator.next
-                        new_element.prev = iterator
-                        iterator.next.prev = new_element
-                        iterator.next = new_element
-                        break
+        element = self._find_element(element_after)
+        if element is not None:
+            self._link_after(element, Element(element_value))
         else:
             print("Element doesn't exist in the LinkedList.")
 
+    def get_slice(self, item):
+        """Returns a new list with the elements selected by a slice, walking this list once.
+
+        :param item: Slice - the slice, negative bounds and steps work like on a Python list.
+        :return: LinkedList - a new list holding the selected data.
+        """
+        start, stop, step = item.indices(self.size)
+        positions = range(start, stop, step)
+        selected = []
+        if len(positions) > 0:
+            first = min(positions[0], positions[-1])
+            last = max(positions[0], positions[-1])
+            position = 0
+            iterator = self.head
+            while position <= last:
+                if position >= first and (position - first) % abs(step) == 0:
+                    selected.append(iterator.data)
+                iterator = iterator.next
+                position += 1
+            if step < 0:
+                selected.reverse()
+
+        result = type(self)(index_values=self.value_index is not None)
+        result.extend(selected)
+        return result
+
+    def extend(self, iterable):
+        """Appends every value of an iterable to the end of the list. Generators are consumed one value at a time.
+
+        :param iterable: Iterable - the values to append.
+        """
+        if iterable is self:
+            iterable = list(self)
+        for value in iterable:
+            self._link_after(self.tail, Element(value))
+
     def insert_range(self, insert_range):
         """Inserts a range of provided values to the list. Doesn't keep previous values.
 
@@ -183,67 +208,181 @@ class LinkedList:
         if len(insert_range) == 0:
             raise IndexError('Invalid index.')
         else:
+            self.clear()
             self.head = Element(insert_range[0])
+            self._index_add(self.head)
             iterator = self.head
             for i in range(1, len(insert_range)):
                 new_element = Element(insert_range[i])
+                new_element.prev = iterator
                 iterator.next = new_element
                 iterator = iterator.next
-                iterator.prev = new_element
+                self._index_add(iterator)
+            self.tail = iterator
+            self.size = len(insert_range)
 
     def delete_at_start(self):
         """Deletes the first element in the list.
+
+        :return: Object - the data of the deleted element, None if the list is empty.
         """
-        if self.head and self.head.next:
-            self.head = self.head.next
+        if self.head is not None:
+            return self.remove_element(self.head)
 
     def delete_at_end(self):
         """Deletes the last element in the list.
+
+        :return: Object - the data of the deleted element, None if the list is empty.
         """
-        if self.head and self.head.next:
-            iterator = self.head
-            while iterator.next.next:
-                iterator = iterator.next
-            iterator.next = None
-        elif self.head:
-            self.head.next = None
+        if self.tail is not None:
+            return self.remove_element(self.tail)
 
     def delete_at_index(self, index):
         """Deletes an element at the given index.
 
         :param index: Integer - index of element to be deleted.
         """
-        if index < 0 or index > self.length() - 1:
+        if index < 0 or index > self.size - 1:
             raise IndexError('Invalid index.')
+        elif index == self.size - 1:
+            self._unlink(self.tail)
         else:
             position = 0
             iterator = self.head
-            while position != index - 1:
+            while position != index:
                 iterator = iterator.next
                 position += 1
 
-            iterator.next.next.prev = iterator
-            iterator.next = iterator.next.next
+            self._unlink(iterator)
 
     def delete_by_value(self, element_value):
         """Deleted a provided element from the list based on it's value.
 
         :param element_value: Object - the element to be deleted.
         """
-        if element_value in self.get_elements():
-            position = 0
+        element = self._find_element(element_value)
+        if element is not None:
+            self._unlink(element)
+
+    def splice(self, other):
+        """Moves every element of another list to the end of this list by relinking the two chains. O(1) unless one of
+        the lists keeps a value index, which is then updated per moved element. The other list is empty afterwards.
+
+        :param other: LinkedList - the list to take the elements from.
+        """
+        if other is self or other.head is None:
+            return
+
+        self._attach_run(other, other.head, other.tail, other.size)
+
+    def splice_range(self, start, end, other):
+        """Moves the elements of another list from index start up to but not including end to the end of this list.
+        Only the links at the borders of the range change, so the cost is the walk to the range in the other list.
+
+        :param start: Integer - index of the first element to move.
+        :param end: Integer - index after the last element to move.
+        :param other: LinkedList - the list to take the elements from, can be this list.
+        """
+        if start < 0 or end > other.size or start > end:
+            raise IndexError('Invalid index.')
+        if start == end:
+            return
+
+        first = other.head
+        for _ in range(start):
+            first = first.next
+        last = first
+        for _ in range(end - start - 1):
+            last = last.next
+        self._attach_run(other, first, last, end - start)
+
+    def remove_element(self, element):
+        """Removes an element of this list in O(1), given the element itself rather than its value or index.
+
+        :param element: Element - the element to remove, as returned by insert_at_start or insert_at_end.
+        :return: Object - the data of the removed element.
+        """
+        self._unlink(element)
+        return element.data
+
+    def move_to_start(self, element):
+        """Moves an element of this list to the start in O(1).
+
+        :param element: Element - the element to move.
+        """
+        if element is not self.head:
+            self._unlink(element)
+            self._link_after(None, element)
+
+    def move_to_end(self, element):
+        """Moves an element of this list to the end in O(1).
+
+        :param element: Element - the element to move.
+        """
+        if element is not self.tail:
+            self._unlink(element)
+            self._link_after(self.tail, element)
+
+    def sort(self, key=None, reverse=False):
+        """Sorts the list in place with a stable bottom-up merge sort in O(n log n). Only the links are changed, the
+        elements themselves are kept.
+
+        :param key: Function - computes the value to sort an element by, called once per element.
+        :param reverse: Boolean - sort in descending order, equal elements still keep their order.
+        """
+        if self.size < 2:
+            return
+
+        sort_key = _sort_key(self.head, key)
+        width = 1
+        while width < self.size:
+            head = tail = None
             iterator = self.head
-            while iterator.next:
-                if iterator.data == element_value:
-                    self.delete_at_index(position)
-                    break
+            while iterator is not None:
+                left = iterator
+                right = _split(left, width)
+                iterator = _split(right, width)
+                run_head, run_tail = _merge_runs(left, right, sort_key, reverse)
+                if tail is None:
+                    head = run_head
+                else:
+                    tail.next = run_head
+                tail = run_tail
+            self.head = head
+            width *= 2
+        self._relink()
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """Merges another sorted list into this sorted list in linear time by relinking its elements, no element is
+        copied. The other list is empty afterwards. On equal values the elements of this list come first.
+
+        :param other: LinkedList - the sorted list to merge in.
+        :param key: Function - the key both lists are sorted by.
+        :param reverse: Boolean - both lists are sorted in descending order.
+        """
+        if other is self or other.head is None:
+            return
+
+        if self.value_index is not None:
+            iterator = other.head
+            while iterator is not None:
+                self._index_add(iterator)
                 iterator = iterator.next
-                position += 1
+
+        sort_key = _sort_key(self.head, key, other.head)
+        self.head = _merge_runs(self.head, other.head, sort_key, reverse)[0]
+        self.size += other.size
+        other.clear()
+        self._relink()
 
     def clear(self):
         """Clears the list.
         """
         self.head = None
+        self.tail = None
+        self.size = 0
+        if self.value_index is not None:
+            self.value_index = {}
 
     def get_elements(self):
         """Returns all elements in the list.
@@ -272,3 +411,199 @@ class LinkedList:
             print('LinkedList is empty.')
         else:
             print(self.get_elements())
+
+    def _find_element(self, value):
+        """Finds the first element holding the value, straight from the index when the value is unique.
+
+        :param value: Object - the data to look for.
+        :return: Element - the element, None if the value is not in the list.
+        """
+        if self.value_index is not None:
+            elements = self.value_index.get(value)
+            if elements is None:
+                return None
+            elif len(elements) == 1:
+                return elements[0]
+
+        iterator = self.head
+        while iterator is not None and iterator.data != value:
+            iterator = iterator.next
+        return iterator
+
+    def _link_after(self, previous, element):
+        """Links a new element into the list and updates the tail, size and index.
+
+        :param previous: Element - the element to link after, None to link at the start.
+        :param element: Element - the new element.
+        """
+        element.prev = previous
+        if previous is None:
+            element.next = self.head
+            self.head = element
+        else:
+            element.next = previous.next
+            previous.next = element
+        if element.next is None:
+            self.tail = element
+        else:
+            element.next.prev = element
+        self.size += 1
+        self._index_add(element)
+
+    def _unlink(self, element):
+        """Unlinks an element from the list and updates the tail, size and index.
+
+        :param element: Element - the element to unlink.
+        """
+        if element.prev is None:
+            self.head = element.next
+        else:
+            element.prev.next = element.next
+        if element.next is None:
+            self.tail = element.prev
+        else:
+            element.next.prev = element.prev
+        element.prev = None
+        element.next = None
+        self.size -= 1
+        self._index_remove(element)
+
+    def _relink(self):
+        """
+        Walks the chain once after it was relinked to set the prev pointers and the tail again.
+        """
+        previous = None
+        iterator = self.head
+        while iterator is not None:
+            iterator.prev = previous
+            previous = iterator
+            iterator = iterator.next
+        self.tail = previous
+
+    def _attach_run(self, other, first, last, count):
+        """Cuts a run of linked elements out of a list and links it to the end of this list.
+
+        :param other: LinkedList - the list the run belongs to.
+        :param first: Element - the first element of the run.
+        :param last: Element - the last element of the run.
+        :param count: Integer - number of elements in the run.
+        """
+        if first.prev is None:
+            other.head = last.next
+        else:
+            first.prev.next = last.next
+        if last.next is None:
+            other.tail = first.prev
+        else:
+            last.next.prev = first.prev
+        other.size -= count
+
+        if other.value_index is not None or self.value_index is not None:
+            iterator = first
+            while iterator is not last.next:
+                other._index_remove(iterator)
+                self._index_add(iterator)
+                iterator = iterator.next
+
+        last.next = None
+        first.prev = self.tail
+        if self.tail is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self.size += count
+
+    def _index_add(self, element):
+        """Registers an element under its value in the index, if the list keeps one.
+
+        :param element: Element - the element to register.
+        """
+        if self.value_index is not None:
+            self.value_index.setdefault(element.data, []).append(element)
+
+    def _index_remove(self, element):
+        """Removes an element from the index, if the list keeps one.
+
+        :param element: Element - the element to remove.
+        """
+        if self.value_index is not None:
+            elements = self.value_index[element.data]
+            if len(elements) == 1:
+                del self.value_index[element.data]
+            else:
+                elements.remove(element)
+
+
+def _sort_key(head, key, other_head=None):
+    """Returns a function giving the sort key of an element. A key function is called once per element up front and
+    the results are looked up by element identity while merging.
+
+    :param head: Element - the first element of the chain to sort.
+    :param key: Function - the key function, None to sort by the data itself.
+    :param other_head: Element - the first element of a second chain that is merged in.
+    :return: Function - maps an element to its sort key.
+    """
+    if key is None:
+        return attrgetter('data')
+
+    keys = {}
+    for iterator in (head, other_head):
+        while iterator is not None:
+            keys[id(iterator)] = key(iterator.data)
+            iterator = iterator.next
+    return lambda element: keys[id(element)]
+
+
+def _split(start, count):
+    """Cuts a chain after its first count elements.
+
+    :param start: Element - the first element of the chain, can be None.
+    :param count: Integer - number of elements to keep in the first part.
+    :return: Element - the first element of the rest, None if nothing is left.
+    """
+    while count > 1 and start is not None:
+        start = start.next
+        count -= 1
+    if start is None:
+        return None
+    rest = start.next
+    start.next = None
+    return rest
+
+
+def _merge_runs(left, right, sort_key, reverse):
+    """Merges two sorted chains into one by relinking their next pointers. Ties are taken from the left chain.
+
+    :param left: Element - the first element of the first chain, can be None.
+    :param right: Element - the first element of the second chain, can be None.
+    :param sort_key: Function - maps an element to its sort key.
+    :param reverse: Boolean - the chains are sorted in descending order.
+    :return: Tuple - the first and last element of the merged chain.
+    """
+    head = tail = None
+    while left is not None and right is not None:
+        if reverse:
+            take_right = sort_key(left) < sort_key(right)
+        else:
+            take_right = sort_key(right) < sort_key(left)
+        if take_right:
+            element = right
+            right = right.next
+        else:
+            element = left
+            left = left.next
+        if tail is None:
+            head = element
+        else:
+            tail.next = element
+        tail = element
+
+    rest = left if left is not None else right
+    if tail is None:
+        head = tail = rest
+    else:
+        tail.next = rest
+    while tail is not None and tail.next is not None:
+        tail = tail.next
+    return head, tail
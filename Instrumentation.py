@@ -0,0 +1,325 @@
+"""
+Opt-in instrumentation for the lists and trees.
+
+enable() swaps the link and data slots of the node classes for counting descriptors and wraps the public methods of
+the structures, disable() puts the original slots and methods back. While disabled nothing is patched, so the
+structures run exactly as fast as without this module.
+
+Per operation it counts calls, nodes visited (reads of next, prev, left, right and parent links), comparisons (reads
+of node data, which every comparison does) and a histogram of nodes visited per call, bucketed by powers of two.
+Node allocations are counted per node class. Hooks added with add_hook receive every top level call, so the numbers
+can be forwarded to a metrics pipeline as they happen.
+
+Lazy traversals are counted while they are consumed, as one call when they finish. The running counters are kept per
+thread, so operations running at the same time in different threads are not credited with each other's work.
+"""
+import functools
+import inspect
+import threading
+import time
+from collections import Counter, defaultdict
+
+import BinaryTree
+import DoubleLinkedList
+import LinkedList
+import SkipList
+
+NODE_CLASSES = (LinkedList.Element, DoubleLinkedList.Element, SkipList.Element, BinaryTree.BinaryTreeNode)
+STRUCTURE_CLASSES = (LinkedList.LinkedList, DoubleLinkedList.LinkedList, SkipList.SkipList, BinaryTree.BinaryTreeNode,
+                     BinaryTree.AugmentedTreeNode, BinaryTree.AVLTreeNode)
+DATA_FIELDS = ('data', 'key')
+LINK_FIELDS = ('next', 'prev', 'left', 'right', 'parent')
+WRAPPED_DUNDERS = ('__getitem__', '__setitem__', '__contains__')
+
+
+class _Counters(threading.local):
+    """
+    Running totals the counting descriptors increment, one set per thread.
+    """
+    def __init__(self):
+        self.visits = 0
+        self.comparisons = 0
+        self.depth = 0
+
+
+class _CountingSlot:
+    """
+    Descriptor that forwards to the original slot of a node class and counts every read.
+    """
+    def __init__(self, slot, counter):
+        self.slot = slot
+        self.counter = counter
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if self.counter == 'visits':
+            _counters.visits += 1
+        else:
+            _counters.comparisons += 1
+        return self.slot.__get__(instance, owner)
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance):
+        self.slot.__delete__(instance)
+
+
+_counters = _Counters()
+_calls = Counter()
+_visits = Counter()
+_comparisons = Counter()
+_seconds = Counter()
+_histograms = defaultdict(Counter)
+_allocations = Counter()
+_lock = threading.Lock()
+_hooks = []
+_originals = []
+
+
+def is_enabled():
+    """Tells if the instrumentation is active.
+
+    :return: Boolean - True between enable() and disable().
+    """
+    return bool(_originals)
+
+
+def enable():
+    """
+    Patches the node classes and structures so every operation is counted. Calling it twice has no effect.
+    """
+    if _originals:
+        return
+
+    for node_class in NODE_CLASSES:
+        _patch(node_class, '__init__', _wrap_allocation(node_class.__init__))
+        for field in DATA_FIELDS + LINK_FIELDS:
+            slot = node_class.__dict__.get(field)
+            if slot is not None:
+                _patch(node_class, field, _CountingSlot(slot, 'comparisons' if field in DATA_FIELDS else 'visits'))
+
+    for structure_class in STRUCTURE_CLASSES:
+        for name, attribute in list(structure_class.__dict__.items()):
+            if callable(attribute) and (not name.startswith('_') or name in WRAPPED_DUNDERS):
+                _patch(structure_class, name, _wrap_operation(name, attribute, True))
+
+    _patch(BinaryTree, 'build_tree_from_list', _wrap_operation('build_tree_from_list',
+                                                               BinaryTree.build_tree_from_list, False))
+
+
+def disable():
+    """
+    Restores the original node classes and structures. The collected numbers are kept until reset().
+    """
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+
+
+def reset():
+    """
+    Drops every collected number.
+    """
+    with _lock:
+        for counter in (_calls, _visits, _comparisons, _seconds, _allocations):
+            counter.clear()
+        _histograms.clear()
+
+
+def add_hook(callback):
+    """Registers a callback for every top level operation while enabled.
+
+    :param callback: Function - called with the operation name, nodes visited, comparisons and seconds taken.
+    """
+    _hooks.append(callback)
+
+
+def remove_hook(callback):
+    """Removes a callback registered with add_hook.
+
+    :param callback: Function - the callback to remove.
+    """
+    _hooks.remove(callback)
+
+
+def snapshot():
+    """Returns a copy of the numbers collected so far.
+
+    :return: Dictionary - calls, nodes_visited, comparisons and seconds per operation, the visit histogram per
+        operation keyed by the power of two bucket upper bound, and allocations per node class.
+    """
+    with _lock:
+        return {
+            'calls': dict(_calls),
+            'nodes_visited': dict(_visits),
+            'comparisons': dict(_comparisons),
+            'seconds': dict(_seconds),
+            'visit_histogram': {operation: dict(histogram) for operation, histogram in _histograms.items()},
+            'allocations': dict(_allocations),
+        }
+
+
+def tree_profile(root):
+    """Measures the shape of a tree, to catch trees that degenerate into lists.
+
+    :param root: BinaryTreeNode - the root of the tree.
+    :return: Dictionary - the height of the tree, its number of nodes and how many nodes sit at every depth.
+    """
+    histogram = Counter()
+    stack = [(root, 0)] if root is not None else []
+    while stack:
+        node, depth = stack.pop()
+        histogram[depth] += 1
+        if node.left is not None:
+            stack.append((node.left, depth + 1))
+        if node.right is not None:
+            stack.append((node.right, depth + 1))
+
+    return {
+        'height': max(histogram) + 1 if histogram else 0,
+        'size': sum(histogram.values()),
+        'depth_histogram': dict(sorted(histogram.items())),
+    }
+
+
+def _patch(owner, name, replacement):
+    """Replaces an attribute and remembers the original for disable().
+
+    :param owner: Object - the class or module holding the attribute.
+    :param name: String - the attribute name.
+    :param replacement: Object - the new attribute.
+    """
+    _originals.append((owner, name, owner.__dict__[name]))
+    setattr(owner, name, replacement)
+
+
+def _bucket(visits):
+    """Returns the smallest power of two not below the given count, 0 for 0.
+
+    :param visits: Integer - a node visit count.
+    :return: Integer - the histogram bucket.
+    """
+    return 1 << (visits - 1).bit_length() if visits else 0
+
+
+def _wrap_allocation(init):
+    """Wraps a node __init__ so allocations are counted under the class of the new node.
+
+    :param init: Function - the original __init__.
+    :return: Function - the counting __init__.
+    """
+    @functools.wraps(init)
+    def counting_init(self, *args, **kwargs):
+        with _lock:
+            _allocations[type(self).__name__] += 1
+        init(self, *args, **kwargs)
+
+    return counting_init
+
+
+def _wrap_operation(name, function, is_method):
+    """Wraps an operation so its calls are counted. Visits and comparisons are credited to the outermost operation
+    only, calls it makes to other operations are counted as calls alone. Generator functions get a generator that
+    counts while it is consumed.
+
+    :param name: String - the operation name.
+    :param function: Function - the original method or function.
+    :param is_method: Boolean - prefix the name with the class of the instance it is called on.
+    :return: Function - the counting operation.
+    """
+    if inspect.isgeneratorfunction(function):
+        return _wrap_generator(name, function, is_method)
+
+    @functools.wraps(function)
+    def counting_operation(*args, **kwargs):
+        operation = _count_call(name, args, is_method)
+        if _counters.depth:
+            return function(*args, **kwargs)
+
+        _counters.depth += 1
+        visits = _counters.visits
+        comparisons = _counters.comparisons
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _counters.depth -= 1
+            _record(operation, _counters.visits - visits, _counters.comparisons - comparisons,
+                    time.perf_counter() - start)
+
+    return counting_operation
+
+
+def _wrap_generator(name, function, is_method):
+    """Wraps a lazy operation so the work of every step is counted as the generator is consumed, and recorded as one
+    call when it finishes or is closed. Work done by the consumer between steps is not credited to it.
+
+    :param name: String - the operation name.
+    :param function: Function - the original generator method or function.
+    :param is_method: Boolean - prefix the name with the class of the instance it is called on.
+    :return: Function - the counting generator function.
+    """
+    @functools.wraps(function)
+    def counting_generator(*args, **kwargs):
+        operation = _count_call(name, args, is_method)
+        generator = function(*args, **kwargs)
+        if _counters.depth:
+            yield from generator
+            return
+
+        visits = comparisons = 0
+        elapsed = 0.0
+        try:
+            while True:
+                _counters.depth += 1
+                visits_before = _counters.visits
+                comparisons_before = _counters.comparisons
+                start = time.perf_counter()
+                try:
+                    value = next(generator)
+                except StopIteration:
+                    return
+                finally:
+                    _counters.depth -= 1
+                    elapsed += time.perf_counter() - start
+                    visits += _counters.visits - visits_before
+                    comparisons += _counters.comparisons - comparisons_before
+                yield value
+        finally:
+            generator.close()
+            _record(operation, visits, comparisons, elapsed)
+
+    return counting_generator
+
+
+def _count_call(name, args, is_method):
+    """Counts a call of an operation.
+
+    :param name: String - the operation name.
+    :param args: Tuple - the arguments of the call, the instance first for a method.
+    :param is_method: Boolean - prefix the name with the class of the instance.
+    :return: String - the full operation name.
+    """
+    operation = '{}.{}'.format(type(args[0]).__name__, name) if is_method else name
+    with _lock:
+        _calls[operation] += 1
+    return operation
+
+
+def _record(operation, visits, comparisons, elapsed):
+    """Adds the work of a finished top level call to the totals and passes it to the hooks.
+
+    :param operation: String - the full operation name.
+    :param visits: Integer - nodes visited by the call.
+    :param comparisons: Integer - comparisons made by the call.
+    :param elapsed: Float - seconds the call took.
+    """
+    with _lock:
+        _visits[operation] += visits
+        _comparisons[operation] += comparisons
+        _seconds[operation] += elapsed
+        _histograms[operation][_bucket(visits)] += 1
+    for hook in _hooks:
+        hook(operation, visits, comparisons, elapsed)
@@ -0,0 +1,219 @@
+import time
+
+from DoubleLinkedList import LinkedList
+
+
+class CacheEntry:
+    """
+    Helper class for LRUCache, the data of every element in the recency list.
+    """
+    __slots__ = ('key', 'value', 'size', 'expires_at')
+
+    def __init__(self, key, value, size, expires_at):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class LRUCache:
+    """
+    Least recently used cache built from a dict of keys to elements of a DoubleLinkedList. The most recently used entry
+    sits at the start of the list and eviction takes entries from the end, so get, put and eviction are all O(1).
+
+    The cache can be bounded by the number of entries, by the total size of the entries or both. Entries can expire
+    after a time to live, expired entries are dropped when they are next looked up or by purge_expired().
+    """
+    def __init__(self, capacity=None, max_size=None, size_function=None, ttl=None, on_evict=None,
+                 clock=time.monotonic):
+        """
+        :param capacity: Integer - maximum number of entries, None for no limit.
+        :param max_size: Integer - maximum total size of the entries, None for no limit.
+        :param size_function: Function - computes the size of a value, every value has size 1 without it.
+        :param ttl: Float - default seconds an entry lives after it was put, None to never expire.
+        :param on_evict: Function - called with the key and value of every entry evicted or expired.
+        :param clock: Function - returns the current time in seconds.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError('Capacity must be at least 1.')
+
+        self.capacity = capacity
+        self.max_size = max_size
+        self.size_function = size_function
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.clock = clock
+        self.elements = {}
+        self.recency = LinkedList()
+        self.total_size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __contains__(self, key):
+        element = self.elements.get(key)
+        return element is not None and not self._expired(element.data)
+
+    def __getitem__(self, key):
+        element = self._lookup(key)
+        if element is None:
+            raise KeyError(key)
+        return element.data.value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def get(self, key, default=None):
+        """Returns the value cached for a key and marks it as the most recently used.
+
+        :param key: Object - the key to look up.
+        :param default: Object - returned when the key is missing or expired.
+        :return: Object - the cached value or the default.
+        """
+        element = self._lookup(key)
+        return element.data.value if element is not None else default
+
+    def put(self, key, value, ttl=None, size=None):
+        """Caches a value for a key as the most recently used entry, then evicts the least recently used entries
+        until the cache is within its limits again. A value larger than max_size is not cached at all, so it cannot
+        evict every other entry, and an older value of the key is dropped.
+
+        :param key: Object - the key, must be hashable.
+        :param value: Object - the value to cache.
+        :param ttl: Float - seconds this entry lives, overrides the default of the cache.
+        :param size: Integer - size of this entry, overrides the size function of the cache.
+        """
+        if size is None:
+            size = self.size_function(value) if self.size_function else 1
+        if ttl is None:
+            ttl = self.ttl
+        expires_at = self.clock() + ttl if ttl is not None else None
+
+        element = self.elements.get(key)
+        if self.max_size is not None and size > self.max_size:
+            if element is not None:
+                self._remove(element)
+            return
+
+        if element is not None:
+            entry = element.data
+            self.total_size += size - entry.size
+            entry.value = value
+            entry.size = size
+            entry.expires_at = expires_at
+            self.recency.move_to_start(element)
+        else:
+            self.elements[key] = self.recency.insert_at_start(CacheEntry(key, value, size, expires_at))
+            self.total_size += size
+
+        self._evict()
+
+    def pop(self, key, default=None):
+        """Removes a key from the cache without calling on_evict.
+
+        :param key: Object - the key to remove.
+        :param default: Object - returned when the key is missing or expired.
+        :return: Object - the removed value or the default.
+        """
+        element = self.elements.get(key)
+        if element is None:
+            return default
+
+        entry = self._remove(element)
+        return default if self._expired(entry) else entry.value
+
+    def purge_expired(self):
+        """Drops every expired entry, calling on_evict for each.
+
+        :return: Integer - the number of dropped entries.
+        """
+        expired = [element for element in self.elements.values() if self._expired(element.data)]
+        for element in expired:
+            self._expire(element)
+        return len(expired)
+
+    def clear(self):
+        """
+        Drops every entry without calling on_evict. The statistics are kept.
+        """
+        self.elements = {}
+        self.recency.clear()
+        self.total_size = 0
+
+    def stats(self):
+        """Returns the hit and miss statistics of the cache.
+
+        :return: Dictionary - hits, misses, hit_rate, evictions, expirations, the number of entries and their size.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'entries': len(self.elements),
+            'total_size': self.total_size,
+        }
+
+    def _lookup(self, key):
+        """Finds the live element of a key, counts the hit or miss and marks it as the most recently used.
+
+        :param key: Object - the key to look up.
+        :return: Element - the element of the key, None if missing or expired.
+        """
+        element = self.elements.get(key)
+        if element is not None and self._expired(element.data):
+            self._expire(element)
+            element = None
+
+        if element is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.recency.move_to_start(element)
+        return element
+
+    def _expired(self, entry):
+        """Tells if an entry outlived its time to live.
+
+        :param entry: CacheEntry - the entry to check.
+        :return: Boolean - True if the entry expired.
+        """
+        return entry.expires_at is not None and entry.expires_at <= self.clock()
+
+    def _expire(self, element):
+        """Drops an expired element and reports it to on_evict.
+
+        :param element: Element - the element of the expired entry.
+        """
+        entry = self._remove(element)
+        self.expirations += 1
+        if self.on_evict:
+            self.on_evict(entry.key, entry.value)
+
+    def _evict(self):
+        """
+        Drops entries from the least recently used end until the cache is within its limits.
+        """
+        while self.elements and ((self.capacity is not None and len(self.elements) > self.capacity)
+                                 or (self.max_size is not None and self.total_size > self.max_size)):
+            entry = self._remove(self.recency.tail)
+            self.evictions += 1
+            if self.on_evict:
+                self.on_evict(entry.key, entry.value)
+
+    def _remove(self, element):
+        """Unlinks an element from the recency list and forgets its key.
+
+        :param element: Element - the element to remove.
+        :return: CacheEntry - the removed entry.
+        """
+        entry = self.recency.remove_element(element)
+        del self.elements[entry.key]
+        self.total_size -= entry.size
+        return entry
@@ -1,7 +1,12 @@
+from operator import attrgetter
+
+
 class Element:
     """
     Helper class for LinkedList.
     """
+    __slots__ = ('data', 'next')
+
     def __init__(self, data=None, next=None):
         self.data = data
         self.next = next
@@ -10,34 +15,50 @@ class Element:
 class LinkedList:
     """
     LinkedList class where each element is linked to the previous element.
+
+    With index_values set the list also keeps a dict from each value to the elements holding it, so membership tests
+    are O(1) and value based inserts and deletes walk the list at most once. Values must be hashable in that mode.
     """
-    def __init__(self, head=None):
+    def __init__(self, head=None, index_values=False):
         self.head = head
+        self.tail = None
+        self.size = 0
+        self.value_index = {} if index_values else None
+        iterator = head
+        while iterator:
+            self.tail = iterator
+            self.size += 1
+            self._index_add(iterator)
+            iterator = iterator.next
 
     def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.get_slice(item)
         return self.get_element(item)
 
+    def __iter__(self):
+        iterator = self.head
+        while iterator is not None:
+            yield iterator.data
+            iterator = iterator.next
+
     def __setitem__(self, key, value):
         self.set_element(key, value)
 
     def __len__(self):
         return self.length()
 
+    def __contains__(self, value):
+        if self.value_index is not None:
+            return value in self.value_index
+        return self._find(value)[1] is not None
+
     def length(self):
         """Returns the length of the LinkedList.
 
         :return: Integer - length of the list.
         """
-        if self.head is None:
-            return 0
-        else:
-            length = 1
-            iterator = self.head
-            while iterator.next:
-                length += 1
-                iterator = iterator.next
-
-            return length
+        return self.size
 
     def get_element(self, index):
         """Returns the element at the given index.
@@ -45,8 +66,10 @@ class LinkedList:
         :param index: Integer - position of the element in the list.
         :return: Object - the element at the given index.
         """
-        if index < 0 or index > self.length() - 1:
+        if index < 0 or index > self.size - 1:
             raise IndexError('Invalid index.')
+        elif index == self.size - 1:
+            return self.tail.data
         else:
             position = 0
             iterator = self.head
@@ -62,8 +85,10 @@ class LinkedList:
         :param index: Integer - position of the element to set.
         :param data: Object - the data for the element to be set.
         """
-        if index < 0 or index > self.length() - 1:
+        if index < 0 or index > self.size - 1:
             raise IndexError('Invalid index.')
+        elif index == self.size - 1:
+            iterator = self.tail
         else:
             position = 0
             iterator = self.head
@@ -71,34 +96,23 @@ class LinkedList:
                 iterator = iterator.next
                 position += 1
 
-            iterator.data = data
+        self._index_remove(iterator)
+        iterator.data = data
+        self._index_add(iterator)
 
     def insert_at_start(self, value):
         """Inserts a provided element at the start of the list.
 
         :param value: Object - the data to be inserted to the start of the list.
         """
-        if self.head is None:
-            self.head = Element(value)
-        else:
-            element = Element(value)
-            element.next = self.head
-            self.head = element
+        self._link_after(None, Element(value))
 
     def insert_at_end(self, value):
         """Inserts a provided element at the end of the list.
 
         :param value: Object - the data to be inserted to the end of the list.
         """
-        if self.head is None:
-            self.head = Element(value)
-        else:
-            last_element = self.head
-            while last_element.next:
-                last_element = last_element.next
-
-            element = Element(value)
-            last_element.next = element
+        self._link_after(self.tail, Element(value))
 
     def insert_at_index(self, index, value):
         """Inserts an element at the provided index of the list.
@@ -106,8 +120,10 @@ class LinkedList:
         :param index: Integer - the position of the element to be inserted.
         :param value: Object - the data to be inserted to the provided index.
         """
-        if index < 0 or index > self.length() - 1:
+        if index < 0 or index > self.size - 1:
             raise IndexError('Invalid index.')
+        elif index == 0:
+            self.insert_at_start(value)
         else:
             position = 0
             iterator = self.head
@@ -115,9 +131,7 @@ class LinkedList:
                 iterator = iterator.next
                 position += 1
 
-            element = Element(value)
-            element.next = iterator.next
-            iterator.next = element
+            self._link_after(iterator, Element(value))
 
     def insert_before_element(self, element_value, element_before):
         """Inserts a provided element before another element in the list.
@@ -125,21 +139,9 @@ class LinkedList:
         :param element_value: Object - the data to be inserted.
         :param element_before: Object - the element before which the data is inserted.
         """
-        if element_before in self.get_elements():
-            iterator = self.head
-            if iterator.data == element_before:
-                new_element = Element(element_value)
-                new_element.next = iterator
-                self.head = new_element
-            else:
-                while iterator.next:
-                    if iterator.next.data == element_before:
-                        new_element = Element(element_value)
-                        new_element.next = iterator.next
-                        iterator.next = new_element
-                        break
-
-                    iterator = iterator.next
+        previous, element = self._find(element_before)
+        if element is not None:
+            self._link_after(previous, Element(element_value))
         else:
             print("Element doesn't exist in the LinkedList.")
 
@@ -149,23 +151,48 @@ class LinkedList:
         :param element_value: Object - the data to be inserted.
         :param element_after: Object - the element after which the data is inserted.
         """
-        if element_after in self.get_elements():
-            iterator = self.head
-            if iterator.data == element_after:
-                new_element = Element(element_value)
-                new_element.next = iterator.next
-                iterator.next = new_element
-            else:
-                while iterator.next:
-                    iterator = iterator.next
-                    if iterator.data == element_after:
-                        new_element = Element(element_value)
-                        new_element.next = iterator.next
-                        iterator.next = new_element
-                        break
+        element = self._find_element(element_after)
+        if element is not None:
+            self._link_after(element, Element(element_value))
         else:
             print("Element doesn't exist in the LinkedList.")
 
+    def get_slice(self, item):
+        """Returns a new list with the elements selected by a slice, walking this list once.
+
+        :param item: Slice - the slice, negative bounds and steps work like on a Python list.
+        :return: LinkedList - a new list holding the selected data.
+        """
+        start, stop, step = item.indices(self.size)
+        positions = range(start, stop, step)
+        selected = []
+        if len(positions) > 0:
+            first = min(positions[0], positions[-1])
+            last = max(positions[0], positions[-1])
+            position = 0
+            iterator = self.head
+            while position <= last:
+                if position >= first and (position - first) % abs(step) == 0:
+                    selected.append(iterator.data)
+                iterator = iterator.next
+                position += 1
+            if step < 0:
+                selected.reverse()
+
+        result = type(self)(index_values=self.value_index is not None)
+        result.extend(selected)
+        return result
+
+    def extend(self, iterable):
+        """Appends every value of an iterable to the end of the list. Generators are consumed one value at a time.
+
+        :param iterable: Iterable - the values to append.
+        """
+        if iterable is self:
+            iterable = list(self)
+        for value in iterable:
+            self._link_after(self.tail, Element(value))
+
     def insert_range(self, insert_range):
         """Inserts a range of provided values to the list. Doesn't keep previous values.
 
@@ -174,36 +201,51 @@ class LinkedList:
         if len(insert_range) == 0:
             raise IndexError('Invalid index.')
         else:
+            self.clear()
             self.head = Element(insert_range[0])
+            self._index_add(self.head)
             iterator = self.head
             for i in range(1, len(insert_range)):
                 iterator.next = Element(insert_range[i])
                 iterator = iterator.next
+                self._index_add(iterator)
+            self.tail = iterator
+            self.size = len(insert_range)
 
     def delete_at_start(self):
         """Deletes the first element in the list.
+
+        :return: Object - the data of the deleted element, None if the list is empty.
         """
-        if self.head and self.head.next:
-            self.head = self.head.next
+        if self.head is not None:
+            element = self.head
+            self._unlink(None, element)
+            return element.data
 
     def delete_at_end(self):
         """Deletes the last element in the list.
+
+        :return: Object - the data of the deleted element, None if the list is empty.
         """
-        if self.head and self.head.next:
-            iterator = self.head
-            while iterator.next.next:
-                iterator = iterator.next
-            iterator.next = None
-        elif self.head:
-            self.head.next = None
+        if self.head is not None:
+            previous = None
+            if self.head.next:
+                previous = self.head
+                while previous.next.next:
+                    previous = previous.next
+            element = self.tail
+            self._unlink(previous, element)
+            return element.data
 
     def delete_at_index(self, index):
         """Deletes an element at the given index.
 
         :param index: Integer - index of element to be deleted.
         """
-        if index < 0 or index > self.length() - 1:
+        if index < 0 or index > self.size - 1:
             raise IndexError('Invalid index.')
+        elif index == 0:
+            self._unlink(None, self.head)
         else:
             position = 0
             iterator = self.head
@@ -211,27 +253,77 @@ class LinkedList:
                 iterator = iterator.next
                 position += 1
 
-            iterator.next = iterator.next.next
+            self._unlink(iterator, iterator.next)
 
     def delete_by_value(self, element_value):
         """Deleted a provided element from the list based on it's value.
 
         :param element_value: Object - the element to be deleted.
         """
-        if element_value in self.get_elements():
-            position = 0
+        previous, element = self._find(element_value)
+        if element is not None:
+            self._unlink(previous, element)
+
+    def sort(self, key=None, reverse=False):
+        """Sorts the list in place with a stable bottom-up merge sort in O(n log n). Only the links are changed, the
+        elements themselves are kept.
+
+        :param key: Function - computes the value to sort an element by, called once per element.
+        :param reverse: Boolean - sort in descending order, equal elements still keep their order.
+        """
+        if self.size < 2:
+            return
+
+        sort_key = _sort_key(self.head, key)
+        width = 1
+        while width < self.size:
+            head = tail = None
             iterator = self.head
-            while iterator.next:
-                if iterator.data == element_value:
-                    self.delete_at_index(position)
-                    break
+            while iterator is not None:
+                left = iterator
+                right = _split(left, width)
+                iterator = _split(right, width)
+                run_head, run_tail = _merge_runs(left, right, sort_key, reverse)
+                if tail is None:
+                    head = run_head
+                else:
+                    tail.next = run_head
+                tail = run_tail
+            self.head = head
+            width *= 2
+        self._relink()
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """Merges another sorted list into this sorted list in linear time by relinking its elements, no element is
+        copied. The other list is empty afterwards. On equal values the elements of this list come first.
+
+        :param other: LinkedList - the sorted list to merge in.
+        :param key: Function - the key both lists are sorted by.
+        :param reverse: Boolean - both lists are sorted in descending order.
+        """
+        if other is self or other.head is None:
+            return
+
+        if self.value_index is not None:
+            iterator = other.head
+            while iterator is not None:
+                self._index_add(iterator)
                 iterator = iterator.next
-                position += 1
+
+        sort_key = _sort_key(self.head, key, other.head)
+        self.head = _merge_runs(self.head, other.head, sort_key, reverse)[0]
+        self.size += other.size
+        other.clear()
+        self._relink()
 
     def clear(self):
         """Clears the list.
         """
         self.head = None
+        self.tail = None
+        self.size = 0
+        if self.value_index is not None:
+            self.value_index = {}
 
     def get_elements(self):
         """Returns all elements in the list.
@@ -260,3 +352,171 @@ class LinkedList:
             print('LinkedList is empty.')
         else:
             print(self.get_elements())
+
+    def _find(self, value):
+        """Finds the first element holding the value together with the element before it, in a single walk.
+
+        :param value: Object - the data to look for.
+        :return: Tuple - the previous element and the element, the element is None if the value is not in the list.
+        """
+        if self.value_index is not None and value not in self.value_index:
+            return None, None
+
+        previous = None
+        iterator = self.head
+        while iterator is not None and iterator.data != value:
+            previous = iterator
+            iterator = iterator.next
+        return previous, iterator
+
+    def _find_element(self, value):
+        """Finds the first element holding the value, straight from the index when the value is unique.
+
+        :param value: Object - the data to look for.
+        :return: Element - the element, None if the value is not in the list.
+        """
+        if self.value_index is not None:
+            elements = self.value_index.get(value)
+            if elements is None:
+                return None
+            elif len(elements) == 1:
+                return elements[0]
+        return self._find(value)[1]
+
+    def _link_after(self, previous, element):
+        """Links a new element into the list and updates the tail, size and index.
+
+        :param previous: Element - the element to link after, None to link at the start.
+        :param element: Element - the new element.
+        """
+        if previous is None:
+            element.next = self.head
+            self.head = element
+        else:
+            element.next = previous.next
+            previous.next = element
+        if element.next is None:
+            self.tail = element
+        self.size += 1
+        self._index_add(element)
+
+    def _unlink(self, previous, element):
+        """Unlinks an element from the list and updates the tail, size and index.
+
+        :param previous: Element - the element before the one to unlink, None if it is the head.
+        :param element: Element - the element to unlink.
+        """
+        if previous is None:
+            self.head = element.next
+        else:
+            previous.next = element.next
+        if element is self.tail:
+            self.tail = previous
+        element.next = None
+        self.size -= 1
+        self._index_remove(element)
+
+    def _relink(self):
+        """
+        Walks the chain once after it was relinked to find the tail again.
+        """
+        previous = None
+        iterator = self.head
+        while iterator is not None:
+            previous = iterator
+            iterator = iterator.next
+        self.tail = previous
+
+    def _index_add(self, element):
+        """Registers an element under its value in the index, if the list keeps one.
+
+        :param element: Element - the element to register.
+        """
+        if self.value_index is not None:
+            self.value_index.setdefault(element.data, []).append(element)
+
+    def _index_remove(self, element):
+        """Removes an element from the index, if the list keeps one.
+
+        :param element: Element - the element to remove.
+        """
+        if self.value_index is not None:
+            elements = self.value_index[element.data]
+            if len(elements) == 1:
+                del self.value_index[element.data]
+            else:
+                elements.remove(element)
+
+
+def _sort_key(head, key, other_head=None):
+    """Returns a function giving the sort key of an element. A key function is called once per element up front and
+    the results are looked up by element identity while merging.
+
+    :param head: Element - the first element of the chain to sort.
+    :param key: Function - the key function, None to sort by the data itself.
+    :param other_head: Element - the first element of a second chain that is merged in.
+    :return: Function - maps an element to its sort key.
+    """
+    if key is None:
+        return attrgetter('data')
+
+    keys = {}
+    for iterator in (head, other_head):
+        while iterator is not None:
+            keys[id(iterator)] = key(iterator.data)
+            iterator = iterator.next
+    return lambda element: keys[id(element)]
+
+
+def _split(start, count):
+    """Cuts a chain after its first count elements.
+
+    :param start: Element - the first element of the chain, can be None.
+    :param count: Integer - number of elements to keep in the first part.
+    :return: Element - the first element of the rest, None if nothing is left.
+    """
+    while count > 1 and start is not None:
+        start = start.next
+        count -= 1
+    if start is None:
+        return None
+    rest = start.next
+    start.next = None
+    return rest
+
+
+def _merge_runs(left, right, sort_key, reverse):
+    """Merges two sorted chains into one by relinking their next pointers. Ties are taken from the left chain.
+
+    :param left: Element - the first element of the first chain, can be None.
+    :param right: Element - the first element of the second chain, can be None.
+    :param sort_key: Function - maps an element to its sort key.
+    :param reverse: Boolean - the chains are sorted in descending order.
+    :return: Tuple - the first and last element of the merged chain.
+    """
+    head = tail = None
+    while left is not None and right is not None:
+        if reverse:
+            take_right = sort_key(left) < sort_key(right)
+        else:
+            take_right = sort_key(right) < sort_key(left)
+        if take_right:
+            element = right
+            right = right.next
+        else:
+            element = left
+            left = left.next
+        if tail is None:
+            head = element
+        else:
+            tail.next = element
+        tail = element
+
+    rest = left if left is not None else right
+    if tail is None:
+        head = tail = rest
+    else:
+        tail.next = rest
+    while tail is not None and tail.next is not None:
+        tail = tail.next
+    return head, tail
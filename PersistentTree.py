@@ -0,0 +1,268 @@
+import threading
+
+
+class PersistentNode:
+    """
+    Immutable AVL node. Nodes are never changed after they are created, so any number of tree versions can share them.
+    They have no parent pointer, since a shared node has a different parent in every version.
+    """
+    __slots__ = ('data', 'left', 'right', 'height', 'size')
+
+    def __init__(self, data, left=None, right=None):
+        self.data = data
+        self.left = left
+        self.right = right
+        self.height = 1 + max(_height(left), _height(right))
+        self.size = 1 + _size(left) + _size(right)
+
+
+class PersistentTree:
+    """
+    Balanced binary search tree where insert and delete return a new version and leave this one untouched. An update
+    copies only the O(log n) nodes on the path to the changed value and shares every other node with the previous
+    version. A version is safe to read from any thread without locks, old versions are freed once nothing references
+    them anymore.
+    """
+    __slots__ = ('root', 'version')
+
+    def __init__(self, root=None, version=0):
+        self.root = root
+        self.version = version
+
+    def __len__(self):
+        return _size(self.root)
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def __iter__(self):
+        return self.iter_in_order()
+
+    def insert(self, value):
+        """Inserts a number into a new version of the tree. If duplicate the insert will be ignored.
+
+        :param value: Integer - the value to insert
+        :return: PersistentTree - the new version, this version itself if nothing changed.
+        """
+        root = _insert(self.root, value)
+        return self if root is self.root else PersistentTree(root, self.version + 1)
+
+    def delete(self, value):
+        """Deletes a number from a new version of the tree.
+
+        :param value: Integer - the value to delete.
+        :return: PersistentTree - the new version, this version itself if the value was not in the tree.
+        """
+        root = _delete(self.root, value)
+        return self if root is self.root else PersistentTree(root, self.version + 1)
+
+    def search(self, value):
+        """Binary search the tree for a given value.
+
+        :param value: Integer - the value to look for.
+        :return: Boolean - True if found, False if not.
+        """
+        node = self.root
+        while node is not None:
+            if node.data == value:
+                return True
+            node = node.left if value < node.data else node.right
+        return False
+
+    def find_min(self):
+        """
+        Finds the minimum value in the tree, None if the tree is empty.
+        """
+        node = self.root
+        if node is None:
+            return None
+        while node.left is not None:
+            node = node.left
+        return node.data
+
+    def find_max(self):
+        """
+        Finds the maximum value in the tree, None if the tree is empty.
+        """
+        node = self.root
+        if node is None:
+            return None
+        while node.right is not None:
+            node = node.right
+        return node.data
+
+    def in_order_traversal(self):
+        """Traverses the tree from left to right. (left -> root -> right)
+
+        :return: List - list of numbers ordered.
+        """
+        return list(self.iter_in_order())
+
+    def iter_in_order(self):
+        """Lazily traverses the tree from left to right. (left -> root -> right)
+
+        :return: Generator - yields the numbers in order, keeping only the current path in memory.
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.data
+            node = node.right
+
+
+class SnapshotTree:
+    """
+    Holds the current version of a PersistentTree for one or more writers and many readers. Writers are serialized by a
+    lock and publish each new version with a single reference assignment. Readers take snapshot() without any lock
+    and keep reading that version, unaffected by later writes.
+    """
+    def __init__(self, values=()):
+        self.current = build_persistent_tree(values)
+        self._write_lock = threading.Lock()
+
+    def snapshot(self):
+        """Returns the current version for reading.
+
+        :return: PersistentTree - a version that never changes.
+        """
+        return self.current
+
+    def insert(self, value):
+        """Inserts a number and publishes the new version.
+
+        :param value: Integer - the value to insert
+        """
+        with self._write_lock:
+            self.current = self.current.insert(value)
+
+    def delete(self, value):
+        """Deletes a number and publishes the new version.
+
+        :param value: Integer - the value to delete.
+        """
+        with self._write_lock:
+            self.current = self.current.delete(value)
+
+    def search(self, value):
+        """Binary search the current version for a given value.
+
+        :param value: Integer - the value to look for.
+        :return: Boolean - True if found, False if not.
+        """
+        return self.current.search(value)
+
+
+def build_persistent_tree(values):
+    """Builds a perfectly balanced PersistentTree from any numbers, duplicates are dropped.
+
+    :param values: Iterable - the numbers to build the tree from.
+    :return: PersistentTree - the first version of the tree.
+    """
+    sorted_values = []
+    # an iterator, so a plain BinaryTreeNode is not counted by its __len__ before it is walked
+    for value in sorted(iter(values)):
+        if not sorted_values or sorted_values[-1] != value:
+            sorted_values.append(value)
+    return PersistentTree(_build(sorted_values, 0, len(sorted_values) - 1))
+
+
+def _build(values, low, high):
+    """Builds a balanced subtree from a slice of ascending distinct values.
+
+    :param values: List - ascending distinct values.
+    :param low: Integer - index of the first value in the slice.
+    :param high: Integer - index of the last value in the slice.
+    :return: PersistentNode - the root of the subtree, None if the slice is empty.
+    """
+    if low > high:
+        return None
+    middle = (low + high) // 2
+    return PersistentNode(values[middle], _build(values, low, middle - 1), _build(values, middle + 1, high))
+
+
+def _height(node):
+    """Returns the height of a subtree, 0 for a missing child.
+
+    :param node: PersistentNode - the subtree root or None.
+    :return: Integer - the height of the subtree.
+    """
+    return node.height if node is not None else 0
+
+
+def _size(node):
+    """Returns the number of nodes in a subtree, 0 for a missing child.
+
+    :param node: PersistentNode - the subtree root or None.
+    :return: Integer - the size of the subtree.
+    """
+    return node.size if node is not None else 0
+
+
+def _balanced(data, left, right):
+    """Creates a node from its parts, rotating with new nodes when the heights of the parts differ by two.
+
+    :param data: Integer - the value of the node.
+    :param left: PersistentNode - the left subtree.
+    :param right: PersistentNode - the right subtree.
+    :return: PersistentNode - the root of the balanced subtree.
+    """
+    if _height(left) > _height(right) + 1:
+        if _height(left.left) >= _height(left.right):
+            return PersistentNode(left.data, left.left, PersistentNode(data, left.right, right))
+        pivot = left.right
+        return PersistentNode(pivot.data, PersistentNode(left.data, left.left, pivot.left),
+                              PersistentNode(data, pivot.right, right))
+    if _height(right) > _height(left) + 1:
+        if _height(right.right) >= _height(right.left):
+            return PersistentNode(right.data, PersistentNode(data, left, right.left), right.right)
+        pivot = right.left
+        return PersistentNode(pivot.data, PersistentNode(data, left, pivot.left),
+                              PersistentNode(right.data, pivot.right, right.right))
+    return PersistentNode(data, left, right)
+
+
+def _insert(node, value):
+    """Inserts a value by copying the path to it.
+
+    :param node: PersistentNode - the subtree root, None for an empty subtree.
+    :param value: Integer - the value to insert.
+    :return: PersistentNode - the new subtree root, the same node if the value was already there.
+    """
+    if node is None:
+        return PersistentNode(value)
+    if value == node.data:
+        return node
+    if value < node.data:
+        left = _insert(node.left, value)
+        return node if left is node.left else _balanced(node.data, left, node.right)
+    right = _insert(node.right, value)
+    return node if right is node.right else _balanced(node.data, node.left, right)
+
+
+def _delete(node, value):
+    """Deletes a value by copying the path to it, a node with two children takes its in order successor's value.
+
+    :param node: PersistentNode - the subtree root, None for an empty subtree.
+    :param value: Integer - the value to delete.
+    :return: PersistentNode - the new subtree root, the same node if the value was not there.
+    """
+    if node is None:
+        return None
+    if value == node.data:
+        if node.left is None:
+            return node.right
+        if node.right is None:
+            return node.left
+        successor = node.right
+        while successor.left is not None:
+            successor = successor.left
+        return _balanced(successor.data, node.left, _delete(node.right, successor.data))
+    if value < node.data:
+        left = _delete(node.left, value)
+        return node if left is node.left else _balanced(node.data, left, node.right)
+    right = _delete(node.right, value)
+    return node if right is node.right else _balanced(node.data, node.left, right)
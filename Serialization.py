@@ -0,0 +1,236 @@
+"""
+Compact binary files for the trees and lists.
+
+A file is a 16 byte header followed by the numbers as one flat little endian array of 64 bit integers, or of doubles
+when the numbers are all floats. Anything else is rejected rather than converted, so a file loads back exactly the
+numbers that were written. The header holds a magic string telling a tree from a list, the format version,
+the array typecode and the number of values. Tree files hold the numbers in ascending order, list files in list order.
+
+Loading rebuilds the structure in O(N), the numbers of a tree file are already sorted. MappedTree answers queries
+straight from a tree file through mmap instead, so opening it is instant, only the pages a query touches are read and
+every process mapping the file shares them.
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+import BinaryTree
+import DoubleLinkedList
+import SortedKeys
+
+TREE_MAGIC = b'DSBT'
+LIST_MAGIC = b'DSLL'
+VERSION = 1
+HEADER = struct.Struct('<4sBc2xQ')
+
+
+class MappedTree:
+    """
+    Read only tree backed by a memory mapped tree file. The numbers are never loaded, every lookup is a binary search
+    on the mapped array.
+    """
+    def __init__(self, path):
+        """
+        :param path: String - path of a file written by dump_tree.
+        :raises ValueError: if the file is not a tree file, is cut short or too long, or the machine is big endian.
+        """
+        if sys.byteorder != 'little':
+            raise ValueError('MappedTree needs a little endian machine.')
+
+        with open(path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            typecode, _ = _read_header(self._map, TREE_MAGIC, len(self._map))
+        except ValueError:
+            self._map.close()
+            raise
+        self._data = memoryview(self._map)[HEADER.size:]
+        self.keys = self._data.cast(typecode)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def search(self, value):
+        """Binary search the tree for a given value.
+
+        :param value: Integer - the value to look for.
+        :return: Boolean - True if found, False if not.
+        """
+        return SortedKeys.contains(self.keys, value)
+
+    def find_min(self):
+        """
+        Finds the minimum value in the tree, None if the tree is empty.
+        """
+        return self.keys[0] if len(self.keys) > 0 else None
+
+    def find_max(self):
+        """
+        Finds the maximum value in the tree, None if the tree is empty.
+        """
+        return self.keys[-1] if len(self.keys) > 0 else None
+
+    def floor(self, value):
+        """Finds the largest number in the tree smaller than or equal to the given value.
+
+        :param value: Integer - the upper bound.
+        :return: Integer - the floor of the value, None if every number is larger.
+        """
+        return SortedKeys.floor(self.keys, value)
+
+    def ceiling(self, value):
+        """Finds the smallest number in the tree larger than or equal to the given value.
+
+        :param value: Integer - the lower bound.
+        :return: Integer - the ceiling of the value, None if every number is smaller.
+        """
+        return SortedKeys.ceiling(self.keys, value)
+
+    def count_range(self, low, high):
+        """Counts the numbers in the tree between two bounds, both inclusive.
+
+        :param low: Integer - the lower bound.
+        :param high: Integer - the upper bound.
+        :return: Integer - the number of values in the range.
+        """
+        return SortedKeys.count_range(self.keys, low, high)
+
+    def range_iter(self, low, high):
+        """Lazily yields the numbers between two bounds, both inclusive, in ascending order.
+
+        :param low: Integer - the lower bound.
+        :param high: Integer - the upper bound.
+        :return: Generator - yields the numbers in the range.
+        """
+        keys = self.keys
+        for index in range(*SortedKeys.range_bounds(keys, low, high)):
+            yield keys[index]
+
+    def in_order_traversal(self):
+        """Reads every number of the tree in ascending order.
+
+        :return: List - list of numbers ordered.
+        """
+        return self.keys.tolist()
+
+    def close(self):
+        """
+        Releases the views and unmaps the file.
+        """
+        self.keys.release()
+        self._data.release()
+        self._map.close()
+
+
+def dump_tree(tree, path):
+    """Writes the numbers of a tree to a tree file in ascending order.
+
+    :param tree: BinaryTreeNode - the tree to write, None for an empty tree.
+    :param path: String - path of the file.
+    :raises ValueError: if the numbers cannot be written without changing them.
+    """
+    _dump(TREE_MAGIC, tree.iter_in_order() if tree is not None else (), path)
+
+
+def load_tree(path, balanced=False):
+    """Reads a tree file and builds a perfectly balanced tree from it.
+
+    :param path: String - path of the file.
+    :param balanced: Boolean - build a self-balancing AVLTreeNode tree.
+    :return: BinaryTreeNode - the root of the tree, None if the file holds no numbers.
+    """
+    return BinaryTree.build_tree_from_list(_load(TREE_MAGIC, path), balanced=balanced, bulk=True)
+
+
+def dump_list(linked_list, path):
+    """Writes the elements of a LinkedList or DoubleLinkedList to a list file in list order.
+
+    :param linked_list: LinkedList - the list to write.
+    :param path: String - path of the file.
+    :raises ValueError: if the numbers cannot be written without changing them.
+    """
+    _dump(LIST_MAGIC, linked_list, path)
+
+
+def load_list(path, list_class=DoubleLinkedList.LinkedList):
+    """Reads a list file into a new list.
+
+    :param path: String - path of the file.
+    :param list_class: Class - LinkedList class of either module to create.
+    :return: LinkedList - the new list.
+    """
+    linked_list = list_class()
+    linked_list.extend(_load(LIST_MAGIC, path))
+    return linked_list
+
+
+def _dump(magic, values, path):
+    """Writes a header and the packed numbers to a file.
+
+    :param magic: Bytes - the magic string of the file kind.
+    :param values: Iterable - the numbers to write.
+    :param path: String - path of the file.
+    :raises ValueError: if the numbers cannot be written without changing them.
+    """
+    packed = SortedKeys.pack(values)
+    if sys.byteorder != 'little':
+        packed.byteswap()
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(magic, VERSION, packed.typecode.encode(), len(packed)))
+        packed.tofile(file)
+
+
+def _load(magic, path):
+    """Reads the packed numbers of a file.
+
+    :param magic: Bytes - the magic string of the expected file kind.
+    :param path: String - path of the file.
+    :return: List - the numbers.
+    :raises ValueError: if the file is not of the expected kind or its size does not match the header.
+    """
+    with open(path, 'rb') as file:
+        typecode, count = _read_header(file.read(HEADER.size), magic, os.fstat(file.fileno()).st_size)
+        packed = array(typecode)
+        packed.fromfile(file, count)
+    if sys.byteorder != 'little':
+        packed.byteswap()
+    return packed.tolist()
+
+
+def _read_header(data, magic, file_size):
+    """Checks the header at the start of a file against the size of the whole file.
+
+    :param data: Bytes - the file or at least its first bytes.
+    :param magic: Bytes - the magic string of the expected file kind.
+    :param file_size: Integer - the size of the whole file in bytes.
+    :return: Tuple - the typecode and the number of values.
+    :raises ValueError: if the file is not of the expected kind, version or typecode, or its size does not match.
+    """
+    if len(data) < HEADER.size:
+        raise ValueError('File is too short.')
+    file_magic, version, typecode, count = HEADER.unpack_from(data)
+    if file_magic != magic:
+        raise ValueError('File is not a {} file.'.format('tree' if magic == TREE_MAGIC else 'list'))
+    if version != VERSION:
+        raise ValueError('Unsupported file version {}.'.format(version))
+    if typecode not in (b'q', b'd'):
+        raise ValueError('Unsupported typecode {!r}.'.format(typecode))
+    typecode = typecode.decode()
+    if file_size - HEADER.size != count * array(typecode).itemsize:
+        raise ValueError('File size does not match the {} values in the header.'.format(count))
+    return typecode, count
@@ -0,0 +1,196 @@
+import multiprocessing
+from multiprocessing import shared_memory
+
+import SortedKeys
+
+_keys = None
+_segment = None
+
+
+class SharedKeys:
+    """
+    The numbers of a tree exported in ascending order to a multiprocessing.shared_memory segment as one flat array of
+    64 bit integers, or doubles when the numbers are all floats. Other processes attach to the segment by name
+    and read the numbers in place, nothing is pickled or copied per process.
+
+    The process that exported the numbers owns the segment and must close() it, which also frees the memory.
+    """
+    def __init__(self, tree):
+        """
+        :param tree: BinaryTreeNode - the tree to export, None for an empty tree. Any iterable of ascending distinct
+            numbers works as well.
+        :raises ValueError: if the numbers mix integers and floats, are not numbers, or an integer does not fit in 64
+            bits.
+        """
+        # an iterator, so a plain tree is not counted by its __len__ before it is walked
+        keys = SortedKeys.pack(iter(tree) if tree is not None else ())
+        self.typecode = keys.typecode
+        self.count = len(keys)
+        self.segment = shared_memory.SharedMemory(create=True, size=max(len(keys), 1) * keys.itemsize)
+        self.segment.buf[:len(keys) * keys.itemsize] = keys.tobytes()
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def name(self):
+        """
+        The name other processes attach to the segment with.
+        """
+        return self.segment.name
+
+    def close(self):
+        """
+        Closes and frees the segment, processes still attached keep their mapping until they exit.
+        """
+        self.segment.close()
+        self.segment.unlink()
+
+
+class SharedQueryPool:
+    """
+    Process pool that answers batches of search, floor, ceiling and range queries against a tree exported to shared
+    memory. Every worker attaches to the segment once when it starts. A batch is cut into chunks that the workers
+    answer with binary searches on the shared numbers, and the answers come back in the order of the queries.
+
+    The pool works on a snapshot, changes made to the tree afterwards are not seen.
+    """
+    def __init__(self, tree, processes=None, chunk_size=None):
+        """
+        :param tree: BinaryTreeNode - the tree to query.
+        :param processes: Integer - number of worker processes, one per CPU by default.
+        :param chunk_size: Integer - queries sent to a worker at once, by default every batch is cut into four
+            chunks per worker.
+        """
+        self.keys = SharedKeys(tree)
+        self.processes = processes or multiprocessing.cpu_count()
+        self.chunk_size = chunk_size
+        self.pool = multiprocessing.Pool(self.processes, _attach, (self.keys.name, self.keys.typecode, self.keys.count))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def search_many(self, values):
+        """Searches for every value of a batch.
+
+        :param values: Iterable - the values to look for.
+        :return: List - True or False for every value, in order.
+        """
+        return self._map(_search_chunk, list(values))
+
+    def floor_many(self, values):
+        """Finds the floor of every value of a batch.
+
+        :param values: Iterable - the upper bounds.
+        :return: List - the largest number smaller than or equal to every value, None where there is none.
+        """
+        return self._map(_floor_chunk, list(values))
+
+    def ceiling_many(self, values):
+        """Finds the ceiling of every value of a batch.
+
+        :param values: Iterable - the lower bounds.
+        :return: List - the smallest number larger than or equal to every value, None where there is none.
+        """
+        return self._map(_ceiling_chunk, list(values))
+
+    def range_count_many(self, lows, highs):
+        """Counts the numbers between pairs of bounds, both inclusive, for a batch of ranges.
+
+        :param lows: Iterable - the lower bound of every range.
+        :param highs: Iterable - the upper bound of every range, as many as lower bounds.
+        :return: List - the number of values in every range.
+        """
+        return self._map(_range_count_chunk, list(zip(lows, highs)))
+
+    def range_many(self, lows, highs):
+        """Collects the numbers between pairs of bounds, both inclusive, for a batch of ranges.
+
+        :param lows: Iterable - the lower bound of every range.
+        :param highs: Iterable - the upper bound of every range, as many as lower bounds.
+        :return: List - a list of the numbers in every range in ascending order.
+        """
+        return self._map(_range_chunk, list(zip(lows, highs)))
+
+    def close(self):
+        """
+        Stops the workers and frees the shared memory.
+        """
+        self.pool.terminate()
+        self.pool.join()
+        self.keys.close()
+
+    def _map(self, function, queries):
+        """Answers a batch of queries in chunks on the workers.
+
+        :param function: Function - answers one chunk of queries in a worker.
+        :param queries: List - the queries.
+        :return: List - the answers in the order of the queries.
+        """
+        chunk_size = self.chunk_size or max(-(-len(queries) // (self.processes * 4)), 1)
+        chunks = [queries[i:i + chunk_size] for i in range(0, len(queries), chunk_size)]
+        answers = []
+        for chunk_answers in self.pool.map(function, chunks):
+            answers.extend(chunk_answers)
+        return answers
+
+
+def _attach(name, typecode, count):
+    """Attaches a worker to the shared numbers, views them in place without copying.
+
+    :param name: String - name of the shared memory segment.
+    :param typecode: String - typecode of the packed numbers.
+    :param count: Integer - number of packed numbers.
+    """
+    global _keys, _segment
+    _segment = shared_memory.SharedMemory(name=name)
+    _keys = _segment.buf.cast(typecode)[:count]
+
+
+def _search_chunk(values):
+    """
+    Answers a chunk of search queries in a worker.
+    """
+    keys = _keys
+    return [SortedKeys.contains(keys, value) for value in values]
+
+
+def _floor_chunk(values):
+    """
+    Answers a chunk of floor queries in a worker.
+    """
+    keys = _keys
+    return [SortedKeys.floor(keys, value) for value in values]
+
+
+def _ceiling_chunk(values):
+    """
+    Answers a chunk of ceiling queries in a worker.
+    """
+    keys = _keys
+    return [SortedKeys.ceiling(keys, value) for value in values]
+
+
+def _range_count_chunk(ranges):
+    """
+    Answers a chunk of range count queries in a worker.
+    """
+    keys = _keys
+    return [SortedKeys.count_range(keys, low, high) for low, high in ranges]
+
+
+def _range_chunk(ranges):
+    """
+    Answers a chunk of range queries in a worker.
+    """
+    keys = _keys
+    return [keys[slice(*SortedKeys.range_bounds(keys, low, high))].tolist() for low, high in ranges]
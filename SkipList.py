@@ -0,0 +1,220 @@
+import random
+
+MAX_LEVEL = 32
+
+
+class Element:
+    """
+    Helper class for SkipList. Holds a forward link and the number of positions it skips for every level.
+    """
+    __slots__ = ('data', 'next', 'width')
+
+    def __init__(self, data=None, level=1):
+        self.data = data
+        self.next = [None] * level
+        self.width = [1] * level
+
+
+class SkipList:
+    """
+    Indexable SkipList with the positional API of LinkedList. Every link remembers how many positions it skips, so
+    reading, writing, inserting and deleting at an index takes O(log n) expected time instead of a walk from the head.
+    """
+    def __init__(self):
+        self.head = Element(level=MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+
+    def __getitem__(self, item):
+        return self.get_element(item)
+
+    def __setitem__(self, key, value):
+        self.set_element(key, value)
+
+    def __len__(self):
+        return self.length()
+
+    def length(self):
+        """Returns the length of the SkipList.
+
+        :return: Integer - length of the list.
+        """
+        return self.size
+
+    def get_element(self, index):
+        """Returns the element at the given index.
+
+        :param index: Integer - position of the element in the list.
+        :return: Object - the element at the given index.
+        """
+        if index < 0 or index > self.size - 1:
+            raise IndexError('Invalid index.')
+        else:
+            return self._find(index).data
+
+    def set_element(self, index, data):
+        """Sets the element at the given index to the provided object.
+
+        :param index: Integer - position of the element to set.
+        :param data: Object - the data for the element to be set.
+        """
+        if index < 0 or index > self.size - 1:
+            raise IndexError('Invalid index.')
+        else:
+            self._find(index).data = data
+
+    def insert_at_start(self, value):
+        """Inserts a provided element at the start of the list.
+
+        :param value: Object - the data to be inserted to the start of the list.
+        """
+        self._insert(0, value)
+
+    def insert_at_end(self, value):
+        """Inserts a provided element at the end of the list.
+
+        :param value: Object - the data to be inserted to the end of the list.
+        """
+        self._insert(self.size, value)
+
+    def insert_at_index(self, index, value):
+        """Inserts an element at the provided index of the list.
+
+        :param index: Integer - the position of the element to be inserted.
+        :param value: Object - the data to be inserted to the provided index.
+        """
+        if index < 0 or index > self.size - 1:
+            raise IndexError('Invalid index.')
+        else:
+            self._insert(index, value)
+
+    def insert_range(self, insert_range):
+        """Inserts a range of provided values to the list. Doesn't keep previous values.
+
+        :param insert_range: List - The list of values to be inserted.
+        """
+        if len(insert_range) == 0:
+            raise IndexError('Invalid index.')
+        else:
+            self.clear()
+            for value in insert_range:
+                self._insert(self.size, value)
+
+    def delete_at_index(self, index):
+        """Deletes an element at the given index.
+
+        :param index: Integer - index of element to be deleted.
+        """
+        if index < 0 or index > self.size - 1:
+            raise IndexError('Invalid index.')
+
+        chain = self._predecessors(index)[0]
+        target = chain[0].next[0]
+        for level in range(self.level):
+            if level < len(target.next):
+                chain[level].next[level] = target.next[level]
+                chain[level].width[level] += target.width[level] - 1
+            else:
+                chain[level].width[level] -= 1
+        self.size -= 1
+
+    def clear(self):
+        """Clears the list.
+        """
+        self.head = Element(level=MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+
+    def get_elements(self):
+        """Returns all elements in the list.
+
+        :return: List - all elements in the list.
+        """
+        if self.size == 0:
+            return None
+        else:
+            list_of_elements = []
+            iterator = self.head.next[0]
+            while iterator:
+                list_of_elements.append(iterator.data)
+                iterator = iterator.next[0]
+
+            return list_of_elements
+
+    def print_elements(self):
+        """Prints all elements in the list.
+        """
+        if self.size == 0:
+            print('SkipList is empty.')
+        else:
+            print(self.get_elements())
+
+    def _find(self, index):
+        """Descends the levels to the element at a valid index.
+
+        :param index: Integer - position of the element.
+        :return: Element - the element at the given index.
+        """
+        node = self.head
+        position = -1
+        for level in range(self.level - 1, -1, -1):
+            while node.next[level] is not None and position + node.width[level] <= index:
+                position += node.width[level]
+                node = node.next[level]
+        return node
+
+    def _predecessors(self, index):
+        """Finds, for every level in use, the last element before the given index and its position.
+
+        :param index: Integer - the position to find the predecessors of.
+        :return: Tuple - the list of predecessor elements and the list of their positions, one entry per level.
+        """
+        chain = [None] * self.level
+        positions = [0] * self.level
+        node = self.head
+        position = -1
+        for level in range(self.level - 1, -1, -1):
+            while node.next[level] is not None and position + node.width[level] < index:
+                position += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+            positions[level] = position
+        return chain, positions
+
+    def _insert(self, index, value):
+        """Inserts a new element so it ends up at the given index, 0 <= index <= length.
+
+        :param index: Integer - the position of the new element.
+        :param value: Object - the data of the new element.
+        """
+        level = _random_level()
+        if level > self.level:
+            for unused_level in range(self.level, level):
+                # a head link to nothing spans up to the end of the list
+                self.head.width[unused_level] = self.size + 1
+            self.level = level
+
+        chain, positions = self._predecessors(index)
+        element = Element(value, level)
+        for level_index in range(self.level):
+            predecessor = chain[level_index]
+            if level_index < level:
+                skipped = index - positions[level_index]
+                element.next[level_index] = predecessor.next[level_index]
+                element.width[level_index] = predecessor.width[level_index] - skipped + 1
+                predecessor.next[level_index] = element
+                predecessor.width[level_index] = skipped
+            else:
+                predecessor.width[level_index] += 1
+        self.size += 1
+
+
+def _random_level():
+    """Picks the number of levels for a new element, each further level with half the chance of the previous one.
+
+    :return: Integer - a level between 1 and MAX_LEVEL.
+    """
+    level = 1
+    while level < MAX_LEVEL and random.random() < 0.5:
+        level += 1
+    return level
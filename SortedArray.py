@@ -0,0 +1,119 @@
+from bisect import bisect_left
+
+import SortedKeys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class SortedArray:
+    """
+    Read only snapshot of ascending distinct values in one contiguous buffer, made by BinaryTreeNode.freeze(). The
+    batch methods answer a whole array of queries with one binary search per query run in native code, NumPy's
+    searchsorted when NumPy is installed and the bisect module otherwise.
+
+    Numbers that are all integers or all floats are packed like SortedKeys.pack() does, into a numpy.ndarray when NumPy
+    is installed and an array otherwise, other values are kept in a list. The batch methods return numpy arrays for
+    an ndarray and lists otherwise.
+    """
+    __slots__ = ('keys',)
+
+    def __init__(self, values):
+        """
+        :param values: Iterable - ascending distinct values.
+        """
+        self.keys = _to_buffer(values)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def search(self, value):
+        """Binary search the snapshot for a given value.
+
+        :param value: Integer - the value to look for.
+        :return: Boolean - True if found, False if not.
+        """
+        return SortedKeys.contains(self.keys, value)
+
+    def rank(self, value):
+        """Counts the values in the snapshot smaller than the given value.
+
+        :param value: Integer - the value to rank.
+        :return: Integer - the number of smaller values.
+        """
+        return bisect_left(self.keys, value)
+
+    def search_many(self, values):
+        """Searches for every value of a batch at once.
+
+        :param values: Iterable - the values to look for.
+        :return: Array - True or False for every value, in order.
+        """
+        keys = self.keys
+        if _is_ndarray(keys):
+            values = numpy.asarray(values)
+            indexes = numpy.searchsorted(keys, values)
+            found = indexes < len(keys)
+            found[found] = keys[indexes[found]] == values[found]
+            return found
+        return [SortedKeys.contains(keys, value) for value in values]
+
+    def rank_many(self, values):
+        """Ranks every value of a batch at once.
+
+        :param values: Iterable - the values to rank.
+        :return: Array - the number of smaller values in the snapshot for every value, in order.
+        """
+        keys = self.keys
+        if _is_ndarray(keys):
+            return numpy.searchsorted(keys, numpy.asarray(values))
+        return [bisect_left(keys, value) for value in values]
+
+    def range_count_many(self, lows, highs):
+        """Counts the values between pairs of bounds, both inclusive, for a whole batch of ranges at once.
+
+        :param lows: Iterable - the lower bound of every range.
+        :param highs: Iterable - the upper bound of every range, as many as lower bounds.
+        :return: Array - the number of values in every range, 0 where the upper bound is below the lower one.
+        """
+        keys = self.keys
+        if _is_ndarray(keys):
+            above_low = numpy.searchsorted(keys, numpy.asarray(lows))
+            up_to_high = numpy.searchsorted(keys, numpy.asarray(highs), 'right')
+            return numpy.maximum(up_to_high - above_low, 0)
+        return [SortedKeys.count_range(keys, low, high) for low, high in zip(lows, highs)]
+
+
+def _is_ndarray(keys):
+    """Tells if the keys are a numpy array, so the batch methods can run vectorized.
+
+    :param keys: Array - the keys of a snapshot.
+    :return: Boolean - True for a numpy.ndarray.
+    """
+    return numpy is not None and isinstance(keys, numpy.ndarray)
+
+
+def _to_buffer(values):
+    """Lays values out in the most compact buffer that can hold them without changing them.
+
+    :param values: Iterable - ascending distinct values.
+    :return: Array - a numpy array or an array of the packed numbers, or a list for values that cannot be packed.
+    """
+    values = list(values)
+    try:
+        keys = SortedKeys.pack(values)
+    except ValueError:
+        return values
+    if numpy is None:
+        return keys
+    keys = numpy.asarray(keys)
+    keys.flags.writeable = False
+    return keys
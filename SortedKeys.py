@@ -0,0 +1,84 @@
+"""
+Helpers for ascending distinct numbers kept in one flat buffer, shared by SortedArray, SharedTree and Serialization.
+
+pack() lays the numbers out as an array of 64 bit integers or of doubles, and the search functions binary search any
+ascending sequence that supports indexing, like an array, a list, a memoryview or a numpy array.
+"""
+import numbers
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+def pack(values):
+    """Packs numbers into an array of 64 bit integers if they are all integers, or of doubles if they are all floats.
+
+    :param values: Iterable - the numbers.
+    :return: Array - the packed numbers.
+    :raises ValueError: if the values mix integers and floats, are not numbers, or an integer does not fit in 64 bits.
+    """
+    values = list(values)
+    if all(isinstance(value, numbers.Integral) and not isinstance(value, bool) for value in values):
+        try:
+            return array('q', values)
+        except OverflowError:
+            raise ValueError('Integers must fit in 64 bits.') from None
+    if all(isinstance(value, float) for value in values):
+        return array('d', values)
+    raise ValueError('Values must be all integers or all floats.')
+
+
+def contains(keys, value):
+    """Binary search ascending keys for a given value.
+
+    :param keys: Sequence - ascending distinct keys.
+    :param value: Integer - the value to look for.
+    :return: Boolean - True if found, False if not.
+    """
+    index = bisect_left(keys, value)
+    return index < len(keys) and keys[index] == value
+
+
+def floor(keys, value):
+    """Finds the largest key smaller than or equal to the given value.
+
+    :param keys: Sequence - ascending distinct keys.
+    :param value: Integer - the upper bound.
+    :return: Integer - the floor of the value, None if every key is larger.
+    """
+    index = bisect_right(keys, value)
+    return keys[index - 1] if index > 0 else None
+
+
+def ceiling(keys, value):
+    """Finds the smallest key larger than or equal to the given value.
+
+    :param keys: Sequence - ascending distinct keys.
+    :param value: Integer - the lower bound.
+    :return: Integer - the ceiling of the value, None if every key is smaller.
+    """
+    index = bisect_left(keys, value)
+    return keys[index] if index < len(keys) else None
+
+
+def range_bounds(keys, low, high):
+    """Finds the positions of the keys between two bounds, both inclusive.
+
+    :param keys: Sequence - ascending distinct keys.
+    :param low: Integer - the lower bound.
+    :param high: Integer - the upper bound.
+    :return: Tuple - the position of the first key in the range and the position after the last one, the first is
+        not smaller than the second for an empty range.
+    """
+    return bisect_left(keys, low), bisect_right(keys, high)
+
+
+def count_range(keys, low, high):
+    """Counts the keys between two bounds, both inclusive.
+
+    :param keys: Sequence - ascending distinct keys.
+    :param low: Integer - the lower bound.
+    :param high: Integer - the upper bound.
+    :return: Integer - the number of keys in the range, 0 if the upper bound is below the lower one.
+    """
+    start, stop = range_bounds(keys, low, high)
+    return max(stop - start, 0)
@@ -0,0 +1,307 @@
+from BinaryTree import AVLTreeNode, _height, _size
+
+_MISSING = object()
+
+
+class TreeMapNode(AVLTreeNode):
+    """
+    AVLTreeNode holding a value next to its key. The key is the data of the node, so every BinaryTreeNode query works
+    on the keys, and the value moves along with the key in rotations and deletes.
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, key, value=None):
+        super().__init__(key)
+        self.value = value
+
+    def _copy_data(self, other):
+        """Copies the key and value of another node into this one.
+
+        :param other: TreeMapNode - the node to copy from.
+        """
+        super()._copy_data(other)
+        self.value = other.value
+
+    def _swap_data(self, other):
+        """Swaps the key and value of this node with another one.
+
+        :param other: TreeMapNode - the node to swap with.
+        """
+        super()._swap_data(other)
+        self.value, other.value = other.value, self.value
+
+
+class TreeMap:
+    """
+    Ordered map from keys to values on a self-balancing tree of TreeMapNodes. Lookups, puts and pops are O(log n),
+    items() walks a key range in order and delete_range drops a whole key range in O(log n + k) by splitting the tree
+    around the range and joining what is left.
+    """
+    def __init__(self, items=()):
+        """
+        :param items: Iterable - key and value pairs to put, a dict works as well.
+        """
+        self.root = None
+        for key, value in (items.items() if isinstance(items, dict) else items):
+            self.put(key, value)
+
+    def __len__(self):
+        return _size(self.root)
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __iter__(self):
+        return (key for key, _ in self.items())
+
+    def __getitem__(self, key):
+        node = self._find(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    def get(self, key, default=None):
+        """Returns the value of a key.
+
+        :param key: Integer - the key to look up.
+        :param default: Object - returned when the key is missing.
+        :return: Object - the value or the default.
+        """
+        node = self._find(key)
+        return node.value if node is not None else default
+
+    def put(self, key, value):
+        """Sets the value of a key, adding the key if it is missing.
+
+        :param key: Integer - the key.
+        :param value: Object - the value.
+        """
+        node = self._locate(key)
+        if node is not None and node.key == key:
+            node.value = value
+        else:
+            self._attach(node, key, value)
+
+    def setdefault(self, key, default=None):
+        """Returns the value of a key, adding the key with the default value first if it is missing. Walks the tree
+        only once either way.
+
+        :param key: Integer - the key.
+        :param default: Object - the value for a missing key.
+        :return: Object - the value of the key.
+        """
+        node = self._locate(key)
+        if node is not None and node.key == key:
+            return node.value
+        self._attach(node, key, default)
+        return default
+
+    def pop(self, key, default=_MISSING):
+        """Removes a key and returns its value.
+
+        :param key: Integer - the key to remove.
+        :param default: Object - returned when the key is missing.
+        :return: Object - the value of the removed key or the default.
+        :raises KeyError: if the key is missing and no default was given.
+        """
+        node = self._find(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+
+        value = node.value
+        self.root = self.root.delete(key)
+        return value
+
+    def find_min(self):
+        """
+        Finds the smallest key in the map, None if the map is empty.
+        """
+        return self.root.find_min() if self.root is not None else None
+
+    def find_max(self):
+        """
+        Finds the largest key in the map, None if the map is empty.
+        """
+        return self.root.find_max() if self.root is not None else None
+
+    def items(self, low=None, high=None):
+        """Lazily yields the key and value pairs in key order, optionally only between two bounds, both inclusive.
+        Starts at the lower bound and follows successors, so only O(log n + k) nodes are visited.
+
+        :param low: Integer - the lower bound, None to start at the smallest key.
+        :param high: Integer - the upper bound, None to go up to the largest key.
+        :return: Generator - yields (key, value) tuples.
+        """
+        if self.root is None:
+            return
+        if low is None:
+            node = self.root.find_node(self.root.find_min())
+        else:
+            node = self.root._ceiling_node(low)
+        while node is not None and (high is None or not high < node.key):
+            yield node.key, node.value
+            node = node.successor()
+
+    def delete_range(self, low, high):
+        """Removes every key between two bounds, both inclusive. The tree is split into the keys below, inside and
+        above the range in O(log n), the middle part is dropped as a whole and the other two parts are joined again.
+
+        :param low: Integer - the lower bound.
+        :param high: Integer - the upper bound.
+        :return: Integer - the number of removed keys.
+        """
+        if self.root is None or high < low:
+            return 0
+
+        below, rest = _split(self.root, low, False)
+        inside, above = _split(rest, high, True)
+        self.root = _concatenate(below, above)
+        return _size(inside)
+
+    def _find(self, key):
+        """Binary search the tree for the node of a key.
+
+        :param key: Integer - the key to look for.
+        :return: TreeMapNode - the node of the key, None if missing.
+        """
+        return self.root.find_node(key) if self.root is not None else None
+
+    def _locate(self, key):
+        """Walks down to the node of a key, or to the node a missing key would be attached below.
+
+        :param key: Integer - the key.
+        :return: TreeMapNode - the node of the key, or the parent for a new node of it, None if the map is empty.
+        """
+        node = self.root
+        if node is None:
+            return None
+        while node.key != key:
+            child = node.left if key < node.key else node.right
+            if child is None:
+                return node
+            node = child
+        return node
+
+    def _attach(self, parent, key, value):
+        """Attaches a node for a missing key below the node _locate found for it and rebalances the path above it.
+
+        :param parent: TreeMapNode - the node _locate returned, None if the map is empty.
+        :param key: Integer - the new key.
+        :param value: Object - the value of the new key.
+        """
+        node = TreeMapNode(key, value)
+        if parent is None:
+            self.root = node
+            return
+
+        if key < parent.key:
+            parent.left = node
+        else:
+            parent.right = node
+        node.parent = parent
+        self.root._rebalance_path(parent)
+
+
+def _split(node, key, inclusive):
+    """Splits a tree into the keys below a bound and the rest, reusing the nodes.
+
+    :param node: TreeMapNode - the root of the tree, detached from any parent.
+    :param key: Integer - the bound.
+    :param inclusive: Boolean - put a key equal to the bound into the lower part.
+    :return: Tuple - the roots of the lower and the upper tree, None for an empty one.
+    """
+    if node is None:
+        return None, None
+
+    left, right = _detach(node.left), _detach(node.right)
+    if node.key < key or (inclusive and node.key == key):
+        lower, upper = _split(right, key, inclusive)
+        return _join(left, node, lower), upper
+    lower, upper = _split(left, key, inclusive)
+    return lower, _join(upper, node, right)
+
+
+def _join(left, node, right):
+    """Joins two trees and a node between them into one balanced tree, in O(difference of their heights).
+
+    :param left: TreeMapNode - root of the tree of smaller keys, None if empty.
+    :param node: TreeMapNode - the node of the key between both trees, its links are overwritten.
+    :param right: TreeMapNode - root of the tree of larger keys, None if empty.
+    :return: TreeMapNode - the root of the joined tree.
+    """
+    if _height(left) > _height(right) + 1:
+        # hang the node and the shorter tree off the right spine of the taller one where the heights match
+        spine = left
+        while _height(spine.right) > _height(right) + 1:
+            spine = spine.right
+        _link(node, spine.right, right)
+        spine.right = node
+        node.parent = spine
+        left._rebalance_path(spine)
+        return left
+
+    if _height(right) > _height(left) + 1:
+        spine = right
+        while _height(spine.left) > _height(left) + 1:
+            spine = spine.left
+        _link(node, left, spine.left)
+        spine.left = node
+        node.parent = spine
+        right._rebalance_path(spine)
+        return right
+
+    _link(node, left, right)
+    node.parent = None
+    return node
+
+
+def _concatenate(left, right):
+    """Joins two trees where every key of the first is smaller than every key of the second.
+
+    :param left: TreeMapNode - root of the tree of smaller keys, None if empty.
+    :param right: TreeMapNode - root of the tree of larger keys, None if empty.
+    :return: TreeMapNode - the root of the joined tree, None if both are empty.
+    """
+    if right is None:
+        return left
+    if left is None:
+        return right
+
+    key = right.find_min()
+    middle = TreeMapNode(key, right.find_node(key).value)
+    return _join(left, middle, _detach(right.delete(key)))
+
+
+def _link(node, left, right):
+    """Makes two trees the children of a node and updates its cached data.
+
+    :param node: TreeMapNode - the new parent.
+    :param left: TreeMapNode - the new left child or None.
+    :param right: TreeMapNode - the new right child or None.
+    """
+    node.left = left
+    node.right = right
+    if left is not None:
+        left.parent = node
+    if right is not None:
+        right.parent = node
+    node._update()
+
+
+def _detach(node):
+    """Cuts a subtree off its parent.
+
+    :param node: TreeMapNode - the subtree root or None.
+    :return: TreeMapNode - the same subtree root.
+    """
+    if node is not None:
+        node.parent = None
+    return node
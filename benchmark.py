@@ -0,0 +1,371 @@
+"""
+Benchmarks the list and tree operations across input sizes and shapes.
+
+Every case builds its structure outside the timer, then times a sample of operations on it. Cases whose estimated
+work is above the budget, like building an unbalanced tree from a million sorted numbers, are recorded as skipped,
+and a case that raises is recorded with its error so the rest of the run still finishes.
+Results are written as JSON and can be compared against a previous run:
+
+    python benchmark.py --sizes 1000 10000 --output new.json --compare old.json --threshold 0.1
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import BinaryTree
+import DoubleLinkedList
+import LinkedList
+import SkipList
+
+SHAPES = ('sorted', 'reversed', 'random')
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+DEFAULT_OPERATIONS = 1000
+DEFAULT_MAX_WORK = 5 * 10 ** 7
+DEFAULT_THRESHOLD = 0.1
+
+
+class Case:
+    """
+    One benchmarked operation on one structure.
+    """
+    def __init__(self, structure, operation, setup, arguments, run, cost, measure_memory=False):
+        """
+        :param structure: String - name of the benchmarked class or module.
+        :param operation: String - name of the benchmarked method.
+        :param setup: Function - builds the structure from the input values, not timed.
+        :param arguments: Function - picks the arguments of the timed operations from the input values.
+        :param run: Function - runs the operation once per argument on the structure, timed.
+        :param cost: Function - estimated steps for a single operation, given the size and shape.
+        :param measure_memory: Boolean - also record the peak memory of a run.
+        """
+        self.structure = structure
+        self.operation = operation
+        self.setup = setup
+        self.arguments = arguments
+        self.run = run
+        self.cost = cost
+        self.measure_memory = measure_memory
+
+    @property
+    def name(self):
+        return '{}.{}'.format(self.structure, self.operation)
+
+
+def make_input(size, shape, seed):
+    """Creates distinct integers in the given order.
+
+    :param size: Integer - number of values.
+    :param shape: String - 'sorted', 'reversed' or 'random'.
+    :param seed: Integer - seed for the random shape.
+    :return: List - the values.
+    """
+    values = list(range(size))
+    if shape == 'reversed':
+        values.reverse()
+    elif shape == 'random':
+        random.Random(seed).shuffle(values)
+    return values
+
+
+def tree_depth(balanced, size, shape):
+    """Estimates the depth of a tree built by inserting the values one by one.
+
+    :param balanced: Boolean - the tree rebalances itself.
+    :param size: Integer - number of values.
+    :param shape: String - order of the values.
+    :return: Integer - the estimated depth.
+    """
+    log_size = max(1, int(math.log2(size + 1)))
+    if balanced:
+        return log_size
+    elif shape == 'random':
+        return 3 * log_size
+    return size
+
+
+def list_cases(name, module_class):
+    """Creates the cases of a list class.
+
+    :param name: String - name used in the results.
+    :param module_class: Class - the list class.
+    :return: List - the cases.
+    """
+    def setup(values, operations):
+        linked_list = module_class()
+        linked_list.insert_range(values)
+        return linked_list
+
+    def sample(values, operations):
+        return random.Random(operations).sample(values, min(operations, len(values)))
+
+    def positions(values, operations):
+        rng = random.Random(operations)
+        return [rng.randrange(len(values)) for _ in range(operations)]
+
+    def deletions(values, operations):
+        # every deletion shrinks the list, so never delete more elements than it holds
+        return positions(values, min(operations, len(values)))
+
+    def insert_at_end(linked_list, arguments):
+        for value in arguments:
+            linked_list.insert_at_end(value)
+
+    def get_element(linked_list, arguments):
+        for index in arguments:
+            linked_list.get_element(index)
+
+    def delete_by_value(linked_list, arguments):
+        for value in arguments:
+            linked_list.delete_by_value(value)
+
+    def delete_at_index(linked_list, arguments):
+        for value in arguments:
+            linked_list.delete_at_index(value % len(linked_list))
+
+    indexed_cost = (lambda size, shape: math.log2(size)) if module_class is SkipList.SkipList \
+        else (lambda size, shape: size)
+    cases = [
+        Case(name, 'insert_at_end', setup, sample, insert_at_end, lambda size, shape: 1),
+        Case(name, 'get_element', setup, positions, get_element, indexed_cost),
+        Case(name, 'delete_at_index', setup, deletions, delete_at_index, indexed_cost),
+        Case(name, 'insert_range', lambda values, operations: module_class(), lambda values, operations: [values],
+             lambda linked_list, arguments: linked_list.insert_range(arguments[0]),
+             lambda size, shape: size * (math.log2(size) if module_class is SkipList.SkipList else 1),
+             measure_memory=True),
+    ]
+    if hasattr(module_class, 'delete_by_value'):
+        cases.append(Case(name, 'delete_by_value', setup, sample, delete_by_value, lambda size, shape: size))
+    return cases
+
+
+def tree_cases(name, balanced):
+    """Creates the cases of a tree type.
+
+    :param name: String - name used in the results.
+    :param balanced: Boolean - benchmark AVLTreeNode instead of BinaryTreeNode.
+    :return: List - the cases.
+    """
+    def setup(values, operations):
+        return BinaryTree.build_tree_from_list(values, balanced=balanced)
+
+    def sample(values, operations):
+        return random.Random(operations).sample(values, min(operations, len(values)))
+
+    def new_values(values, operations):
+        return [value + 0.5 for value in sample(values, operations)]
+
+    def insert(tree, arguments):
+        for value in arguments:
+            tree.insert(value)
+
+    def search(tree, arguments):
+        for value in arguments:
+            tree.search(value)
+
+    def delete(tree, arguments):
+        for value in arguments:
+            tree = tree.delete(value)
+
+    def traversal(method):
+        def run(tree, arguments):
+            for _ in arguments:
+                getattr(tree, method)()
+        return run
+
+    def once(values, operations):
+        return [values]
+
+    def build(tree, arguments):
+        BinaryTree.build_tree_from_list(arguments[0], balanced=balanced)
+
+    def bulk_build(tree, arguments):
+        BinaryTree.build_tree_from_list(arguments[0], balanced=balanced, bulk=True)
+
+    def per_lookup(size, shape):
+        return tree_depth(balanced, size, shape)
+
+    def per_build(size, shape):
+        return size * tree_depth(balanced, size, shape)
+
+    def per_traversal(size, shape):
+        return size
+
+    cases = [
+        Case(name, 'build_tree_from_list', lambda values, operations: None, once, build, per_build,
+             measure_memory=True),
+        Case(name, 'build_tree_from_list(bulk)', lambda values, operations: None, once, bulk_build,
+             lambda size, shape: size * math.log2(size), measure_memory=True),
+        Case(name, 'insert', setup, new_values, insert, per_lookup),
+        Case(name, 'search', setup, sample, search, per_lookup),
+        Case(name, 'delete', setup, sample, delete, per_lookup),
+    ]
+    for method in ('in_order_traversal', 'pre_order_traversal', 'post_order_traversal'):
+        cases.append(Case(name, method, setup, lambda values, operations: range(max(1, operations // 100)),
+                          traversal(method), per_traversal))
+    return cases
+
+
+def all_cases():
+    """Creates every benchmark case.
+
+    :return: List - the cases.
+    """
+    return (list_cases('LinkedList', LinkedList.LinkedList)
+            + list_cases('DoubleLinkedList', DoubleLinkedList.LinkedList)
+            + list_cases('SkipList', SkipList.SkipList)
+            + tree_cases('BinaryTreeNode', False)
+            + tree_cases('AVLTreeNode', True))
+
+
+def run_case(case, size, shape, operations, max_work, seed):
+    """Runs a case on one input and measures it.
+
+    :param case: Case - the case to run.
+    :param size: Integer - number of input values.
+    :param shape: String - order of the input values.
+    :param operations: Integer - number of timed operations, lowered to stay within the work budget.
+    :param max_work: Integer - estimated steps above which the case is skipped.
+    :param seed: Integer - seed for the random shape.
+    :return: Dictionary - the measurements, the reason the case was skipped or the error it raised.
+    """
+    per_operation = max(1, case.cost(size, shape))
+    build_work = size * tree_depth(False, size, shape) if case.structure == 'BinaryTreeNode' else size
+    operations = min(operations, int(max_work // per_operation))
+    if operations < 1 or build_work > max_work:
+        return {'skipped': 'estimated work above --max-work'}
+
+    try:
+        values = make_input(size, shape, seed)
+        arguments = case.arguments(values, operations)
+        structure = case.setup(values, operations)
+        start = time.perf_counter()
+        case.run(structure, arguments)
+        elapsed = time.perf_counter() - start
+        result = {
+            'operations': len(arguments),
+            'seconds': elapsed,
+            'seconds_per_op': elapsed / max(1, len(arguments)),
+        }
+
+        if case.measure_memory:
+            structure = case.setup(values, operations)
+            tracemalloc.start()
+            try:
+                case.run(structure, arguments)
+                result['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    except Exception as error:
+        return {'error': '{}: {}'.format(type(error).__name__, error)}
+
+    return result
+
+
+def run_benchmarks(sizes, shapes, operations, max_work, seed, selected=None, report=None):
+    """Runs every selected case on every size and shape.
+
+    :param sizes: List - input sizes.
+    :param shapes: List - input shapes.
+    :param operations: Integer - timed operations per case.
+    :param max_work: Integer - estimated steps above which a case is skipped.
+    :param seed: Integer - seed for the random shape.
+    :param selected: String - only run cases whose name contains this text.
+    :param report: Function - called with the key and result of every finished case.
+    :return: Dictionary - results keyed by 'Structure.operation[shape, n=size]'.
+    """
+    results = {}
+    for case in all_cases():
+        if selected and selected not in case.name:
+            continue
+        for size in sizes:
+            for shape in shapes:
+                key = '{}[{}, n={}]'.format(case.name, shape, size)
+                results[key] = run_case(case, size, shape, operations, max_work, seed)
+                if report:
+                    report(key, results[key])
+    return results
+
+
+def find_regressions(previous, current, threshold):
+    """Compares two runs and lists the measurements that got worse by more than the threshold.
+
+    :param previous: Dictionary - results of the earlier run.
+    :param current: Dictionary - results of the new run.
+    :param threshold: Float - allowed relative slowdown, 0.1 means 10%.
+    :return: List - (key, metric, previous value, current value) for every regression.
+    """
+    regressions = []
+    for key, result in current.items():
+        old = previous.get(key)
+        if not old or 'seconds_per_op' not in result or 'seconds_per_op' not in old:
+            continue
+        for metric in ('seconds_per_op', 'peak_memory_bytes'):
+            if metric in result and metric in old and old[metric] > 0:
+                if result[metric] > old[metric] * (1 + threshold):
+                    regressions.append((key, metric, old[metric], result[metric]))
+    return regressions
+
+
+def format_result(key, result):
+    """Formats one result line for the console.
+
+    :param key: String - the result key.
+    :param result: Dictionary - the measurements.
+    :return: String - the line.
+    """
+    if 'skipped' in result:
+        return '{:<70} skipped'.format(key)
+    if 'error' in result:
+        return '{:<70} error {}'.format(key, result['error'])
+    line = '{:<70} {:>12.3f} us/op'.format(key, result['seconds_per_op'] * 1e6)
+    if 'peak_memory_bytes' in result:
+        line += '  peak {:>10.1f} KiB'.format(result['peak_memory_bytes'] / 1024)
+    return line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--shapes', nargs='+', choices=SHAPES, default=list(SHAPES))
+    parser.add_argument('--operations', type=int, default=DEFAULT_OPERATIONS,
+                        help='timed operations per case, lowered for slow cases')
+    parser.add_argument('--max-work', type=float, default=DEFAULT_MAX_WORK,
+                        help='skip cases estimated to need more steps than this')
+    parser.add_argument('--only', help='only run cases whose name contains this text')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='JSON file of an earlier run to check for regressions')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='relative slowdown reported as a regression, 0.1 means 10%%')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.shapes, args.operations, args.max_work, args.seed, args.only,
+                             report=lambda key, result: print(format_result(key, result), flush=True))
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump({
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'results': results,
+            }, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as compare_file:
+            previous = json.load(compare_file)['results']
+        regressions = find_regressions(previous, results, args.threshold)
+        for key, metric, old, new in regressions:
+            print('REGRESSION {} {}: {:.6g} -> {:.6g} (+{:.0%})'.format(key, metric, old, new, new / old - 1))
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())